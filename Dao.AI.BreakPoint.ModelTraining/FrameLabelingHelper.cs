@@ -106,8 +106,8 @@ public class FrameLabelingHelper
                         FrameIndex = frameIndex,
                         Timestamp = frameIndex / metadata.FrameRate,
                         IsRightHanded = isRightHanded,
-                        Joints = jointsFlat,
-                        Angles = angles,
+                        Joints = UnlabeledFrameJson.RoundForStorage(jointsFlat),
+                        Angles = UnlabeledFrameJson.RoundForStorage(angles),
                         Phase = -1, // -1 indicates unlabeled, user needs to set 0-4
                     };
 
@@ -212,6 +212,23 @@ internal class UnlabeledFrameJson
     /// Phase label: -1 = unlabeled, 0-4 = labeled phase
     /// </summary>
     public int Phase { get; set; } = -1;
+
+    /// <summary>
+    /// Round feature values to four decimal places before persisting.
+    /// Coordinates are normalized and angles are in degrees, so this keeps
+    /// roughly half-precision accuracy while noticeably shrinking the label
+    /// files on disk. Compute always stays at full float precision; only the
+    /// persisted output is reduced.
+    /// </summary>
+    public static float[] RoundForStorage(float[] values)
+    {
+        var rounded = new float[values.Length];
+        for (int i = 0; i < values.Length; i++)
+        {
+            rounded[i] = MathF.Round(values[i], 4);
+        }
+        return rounded;
+    }
 }
 
 /// <summary>
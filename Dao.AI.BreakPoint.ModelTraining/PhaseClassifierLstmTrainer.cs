@@ -163,6 +163,12 @@ public class PhaseClassifierLstmTrainer
         float bestValLoss = float.MaxValue;
         int patienceCounter = 0;
 
+        // The train/val split is fixed for the whole run, so the padded batch
+        // tensors are identical every epoch. Build them once up front instead
+        // of re-padding and re-allocating them inside the epoch loop.
+        var batches = CreateBatches(trainData, _config.BatchSize);
+        var valBatches = CreateBatches(valData, _config.BatchSize);
+
         for (int epoch = 0; epoch < _config.Epochs; epoch++)
         {
             // Training
@@ -171,8 +177,6 @@ public class PhaseClassifierLstmTrainer
             int trainCorrect = 0;
             int trainTotal = 0;
 
-            var batches = CreateBatches(trainData, _config.BatchSize);
-
             foreach (var (batchFeatures, batchLabels, batchMask) in batches)
             {
                 optimizer.zero_grad();
@@ -217,8 +221,6 @@ public class PhaseClassifierLstmTrainer
 
             using (no_grad())
             {
-                var valBatches = CreateBatches(valData, _config.BatchSize);
-
                 foreach (var (batchFeatures, batchLabels, batchMask) in valBatches)
                 {
                     var output = model.forward(batchFeatures, batchMask);
@@ -301,37 +303,53 @@ public class PhaseClassifierLstmTrainer
     {
         var sequences = new List<(float[,] features, int[] labels)>();
 
-        // Group files by video name
+        // Reading and parsing thousands of small JSON files dominates load
+        // time, so the IO and deserialization run in parallel into a slot
+        // array (keeping results in file order); grouping by video stays a
+        // quick serial pass afterwards.
         var jsonFiles = Directory.GetFiles(phaseDataDirectory, "*.json");
-        var videoGroups = new Dictionary<string, List<LabeledFrameJson>>();
+        var parsedFrames = new LabeledFrameJson?[jsonFiles.Length];
+        var jsonOptions = new JsonSerializerOptions { PropertyNameCaseInsensitive = true };
 
-        foreach (var file in jsonFiles)
-        {
-            try
+        Parallel.For(
+            0,
+            jsonFiles.Length,
+            i =>
             {
-                var json = File.ReadAllText(file);
-                var frameData = JsonSerializer.Deserialize<LabeledFrameJson>(
-                    json,
-                    new JsonSerializerOptions { PropertyNameCaseInsensitive = true }
-                );
-
-                if (frameData == null)
-                    continue;
-
-                var videoName =
-                    frameData.VideoName ?? Path.GetFileNameWithoutExtension(file).Split('_')[0];
-
-                if (!videoGroups.ContainsKey(videoName))
+                try
                 {
-                    videoGroups[videoName] = [];
+                    // Deserialize straight from the stream; ReadAllText would
+                    // materialize each file as a UTF-16 string (twice the file
+                    // size) just to throw it away after parsing.
+                    using var stream = File.OpenRead(jsonFiles[i]);
+                    parsedFrames[i] = JsonSerializer.Deserialize<LabeledFrameJson>(
+                        stream,
+                        jsonOptions
+                    );
+                }
+                catch (Exception ex)
+                {
+                    Console.WriteLine($"Warning: Could not load {jsonFiles[i]}: {ex.Message}");
                 }
-
-                videoGroups[videoName].Add(frameData);
             }
-            catch (Exception ex)
+        );
+
+        var videoGroups = new Dictionary<string, List<LabeledFrameJson>>();
+        for (int i = 0; i < jsonFiles.Length; i++)
+        {
+            var frameData = parsedFrames[i];
+            if (frameData == null)
+                continue;
+
+            var videoName =
+                frameData.VideoName ?? Path.GetFileNameWithoutExtension(jsonFiles[i]).Split('_')[0];
+
+            if (!videoGroups.ContainsKey(videoName))
             {
-                Console.WriteLine($"Warning: Could not load {file}: {ex.Message}");
+                videoGroups[videoName] = [];
             }
+
+            videoGroups[videoName].Add(frameData);
         }
 
         // Convert each video's frames into a sequence
@@ -428,14 +446,18 @@ public class PhaseClassifierLstmTrainer
 
         for (int i = 0; i < data.Count; i += batchSize)
         {
-            var batch = data.Skip(i).Take(batchSize).ToList();
+            // Index into the list directly; Skip/Take re-enumerates from the
+            // start of the list for every batch
+            int actualBatchSize = Math.Min(batchSize, data.Count - i);
 
             // Find max sequence length in batch
-            int maxLen = batch.Max(b => b.features.GetLength(0));
+            int maxLen = 0;
+            for (int b = 0; b < actualBatchSize; b++)
+            {
+                maxLen = Math.Max(maxLen, data[i + b].features.GetLength(0));
+            }
             maxLen = Math.Min(maxLen, _config.MaxSequenceLength);
 
-            int actualBatchSize = batch.Count;
-
             // Create padded tensors
             var featuresData = new float[
                 actualBatchSize,
@@ -447,15 +469,22 @@ public class PhaseClassifierLstmTrainer
 
             for (int b = 0; b < actualBatchSize; b++)
             {
-                var (seqFeatures, seqLabels) = batch[b];
+                var (seqFeatures, seqLabels) = data[i + b];
                 int seqLen = Math.Min(seqFeatures.GetLength(0), maxLen);
 
+                // Both arrays are row-major with FeatureCount floats per
+                // timestep, so the first seqLen rows form one contiguous run
+                // that can be copied as a block instead of element by element.
+                Buffer.BlockCopy(
+                    seqFeatures,
+                    0,
+                    featuresData,
+                    b * maxLen * LstmFeatureExtractor.FeatureCount * sizeof(float),
+                    seqLen * LstmFeatureExtractor.FeatureCount * sizeof(float)
+                );
+
                 for (int t = 0; t < seqLen; t++)
                 {
-                    for (int f = 0; f < LstmFeatureExtractor.FeatureCount; f++)
-                    {
-                        featuresData[b, t, f] = seqFeatures[t, f];
-                    }
                     labelsData[b, t] = seqLabels[t];
                     maskData[b, t] = 1f;
                 }
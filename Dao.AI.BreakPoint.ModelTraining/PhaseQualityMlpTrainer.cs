@@ -347,27 +347,44 @@ public class PhaseQualityMlpTrainer
 
         var aggregated = new float[numFeatures * numStats];
 
+        // Accumulate count/sum/sum-of-squares/min/max in one pass per feature
+        // instead of materializing a filtered list and re-scanning it for each
+        // statistic.
         for (int f = 0; f < numFeatures; f++)
         {
-            var values = frameFeatures
-                .Select(ff => ff[f])
-                .Where(v => !float.IsNaN(v) && !float.IsInfinity(v))
-                .ToList();
+            int count = 0;
+            double sum = 0;
+            double sumSq = 0;
+            float min = float.MaxValue;
+            float max = float.MinValue;
+
+            foreach (var ff in frameFeatures)
+            {
+                float v = ff[f];
+                if (float.IsNaN(v) || float.IsInfinity(v))
+                    continue;
+
+                count++;
+                sum += v;
+                sumSq += (double)v * v;
+                if (v < min)
+                    min = v;
+                if (v > max)
+                    max = v;
+            }
 
             int baseIdx = f * numStats;
 
-            if (values.Count == 0)
+            if (count == 0)
             {
-                aggregated[baseIdx + 0] = 0f; // mean
-                aggregated[baseIdx + 1] = 0f; // std
-                aggregated[baseIdx + 2] = 0f; // range
+                // Buffer is zero-initialized; nothing to write
                 continue;
             }
 
-            float mean = values.Average();
-            float variance = values.Sum(v => (v - mean) * (v - mean)) / values.Count;
+            float mean = (float)(sum / count);
+            float variance = Math.Max(0f, (float)((sumSq - (sum * sum / count)) / count));
             float std = MathF.Sqrt(variance);
-            float range = values.Max() - values.Min();
+            float range = max - min;
 
             aggregated[baseIdx + 0] = Sanitize(mean);
             aggregated[baseIdx + 1] = Sanitize(std);
@@ -384,15 +401,16 @@ public class PhaseQualityMlpTrainer
     {
         for (int i = 0; i < data.Count; i += batchSize)
         {
-            var batch = data.Skip(i).Take(batchSize).ToList();
-            int actualBatchSize = batch.Count;
+            // Index into the list directly; Skip/Take re-enumerates from the
+            // start of the list for every batch
+            int actualBatchSize = Math.Min(batchSize, data.Count - i);
 
             var featuresData = new float[actualBatchSize, PhaseQualityMlpModel.InputSize];
             var scoresData = new float[actualBatchSize];
 
             for (int b = 0; b < actualBatchSize; b++)
             {
-                var (features, score) = batch[b];
+                var (features, score) = data[i + b];
                 for (int f = 0; f < PhaseQualityMlpModel.InputSize && f < features.Length; f++)
                 {
                     featuresData[b, f] = features[f];
@@ -566,8 +566,11 @@ internal class Program
         {
             try
             {
-                var json = await File.ReadAllTextAsync(jsonFile);
-                var frameData = System.Text.Json.JsonSerializer.Deserialize<LabeledFrameJson>(json);
+                await using var stream = File.OpenRead(jsonFile);
+                var frameData =
+                    await System.Text.Json.JsonSerializer.DeserializeAsync<LabeledFrameJson>(
+                        stream
+                    );
 
                 if (frameData != null && frameData.Joints != null && frameData.Angles != null)
                 {
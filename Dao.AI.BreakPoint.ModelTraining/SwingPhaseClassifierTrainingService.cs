@@ -105,14 +105,18 @@ public class SwingPhaseClassifierTrainingService
 
         Console.WriteLine($"Found {jsonFiles.Length} JSON files in {directory}");
 
+        var jsonOptions = new JsonSerializerOptions { PropertyNameCaseInsensitive = true };
+
         foreach (var file in jsonFiles)
         {
             try
             {
-                var json = File.ReadAllText(file);
+                // Stream deserialization avoids holding each file as a
+                // full UTF-16 string alongside the parsed frame list.
+                using var stream = File.OpenRead(file);
                 var frames = JsonSerializer.Deserialize<List<LabeledFrameData>>(
-                    json,
-                    new JsonSerializerOptions { PropertyNameCaseInsensitive = true }
+                    stream,
+                    jsonOptions
                 );
 
                 if (frames != null)
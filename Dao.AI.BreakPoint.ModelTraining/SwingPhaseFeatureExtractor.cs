@@ -2,6 +2,7 @@ namespace Dao.AI.BreakPoint.ModelTraining;
 
 using Dao.AI.BreakPoint.Services.MoveNet;
 using Dao.AI.BreakPoint.Services.SwingAnalyzer;
+using System.Runtime.CompilerServices;
 
 /// <summary>
 /// Extracts pose-relative features for swing phase classification.
@@ -41,6 +42,27 @@ public static class SwingPhaseFeatureExtractor
     private const int LeftKnee = 13;
     private const int RightKnee = 14;
 
+    // Joints used for the relative-position and velocity feature blocks,
+    // hoisted so the index tables are not reallocated per frame
+    private static readonly int[] RelativeJoints =
+    [
+        LeftWrist,
+        RightWrist,
+        LeftElbow,
+        RightElbow,
+        LeftShoulder,
+        RightShoulder,
+    ];
+    private static readonly int[] VelocityJoints =
+    [
+        LeftWrist,
+        RightWrist,
+        LeftElbow,
+        RightElbow,
+        LeftShoulder,
+        RightShoulder,
+    ];
+
     /// <summary>
     /// Extract features for swing phase classification.
     /// </summary>
@@ -52,49 +74,35 @@ public static class SwingPhaseFeatureExtractor
         FrameData? prev2Frame = null
     )
     {
-        var features = new List<float>();
+        // Write into a preallocated buffer at fixed offsets instead of growing
+        // a list and copying it out. Missing previous frames keep the buffer's
+        // zero initialization, so no explicit zero-fill pass is needed.
+        var features = new float[TotalFeatures];
 
         // Current frame
-        AddFrameFeatures(features, keypoints, angles, isRightHanded);
+        AddFrameFeatures(features, 0, keypoints, angles, isRightHanded);
 
         // Previous frame
         if (prevFrame != null)
         {
-            AddFrameFeatures(
-                features,
-                prevFrame.Joints,
-                GetAnglesFromFrameData(prevFrame),
-                isRightHanded
-            );
-        }
-        else
-        {
-            AddZeroFeatures(features, FeaturesPerFrame);
+            AddFrameFeatures(features, FeaturesPerFrame, prevFrame, isRightHanded);
         }
 
         // Two frames ago
         if (prev2Frame != null)
         {
-            AddFrameFeatures(
-                features,
-                prev2Frame.Joints,
-                GetAnglesFromFrameData(prev2Frame),
-                isRightHanded
-            );
-        }
-        else
-        {
-            AddZeroFeatures(features, FeaturesPerFrame);
+            AddFrameFeatures(features, FeaturesPerFrame * 2, prev2Frame, isRightHanded);
         }
 
         // Handedness
-        features.Add(isRightHanded ? 1.0f : 0.0f);
+        features[TotalFeatures - 1] = isRightHanded ? 1.0f : 0.0f;
 
-        return [.. features];
+        return features;
     }
 
     private static void AddFrameFeatures(
-        List<float> features,
+        float[] features,
+        int offset,
         JointData[] keypoints,
         float[] angles,
         bool isRightHanded
@@ -103,9 +111,40 @@ public static class SwingPhaseFeatureExtractor
         // 1. Joint angles (8 features) - these are pose-invariant
         foreach (var angle in angles)
         {
-            features.Add(Sanitize(angle / 180.0f));
+            features[offset++] = Sanitize(angle / 180.0f);
         }
 
+        AddBodyFeatures(features, offset, keypoints, isRightHanded);
+    }
+
+    private static void AddFrameFeatures(
+        float[] features,
+        int offset,
+        FrameData frame,
+        bool isRightHanded
+    )
+    {
+        // 1. Joint angles, written straight from the frame's stored fields
+        // instead of copying them into a temporary array first
+        features[offset++] = Sanitize(frame.LeftElbowAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightElbowAngle / 180.0f);
+        features[offset++] = Sanitize(frame.LeftShoulderAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightShoulderAngle / 180.0f);
+        features[offset++] = Sanitize(frame.LeftHipAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightHipAngle / 180.0f);
+        features[offset++] = Sanitize(frame.LeftKneeAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightKneeAngle / 180.0f);
+
+        AddBodyFeatures(features, offset, frame.Joints, isRightHanded);
+    }
+
+    private static void AddBodyFeatures(
+        float[] features,
+        int offset,
+        JointData[] keypoints,
+        bool isRightHanded
+    )
+    {
         // Calculate hip center as reference point
         var hipCenterX = (keypoints[LeftHip].X + keypoints[RightHip].X) / 2;
         var hipCenterY = (keypoints[LeftHip].Y + keypoints[RightHip].Y) / 2;
@@ -116,39 +155,21 @@ public static class SwingPhaseFeatureExtractor
 
         // 2. Relative positions of key joints (12 features)
         // Positions normalized relative to hip center and torso height
-        int[] relativeJoints =
-        [
-            LeftWrist,
-            RightWrist,
-            LeftElbow,
-            RightElbow,
-            LeftShoulder,
-            RightShoulder,
-        ];
-        foreach (var jointIdx in relativeJoints)
+        foreach (var jointIdx in RelativeJoints)
         {
             var relX = (keypoints[jointIdx].X - hipCenterX) / torsoHeight;
             var relY = (keypoints[jointIdx].Y - hipCenterY) / torsoHeight;
-            features.Add(Sanitize(relX));
-            features.Add(Sanitize(relY));
+            features[offset++] = Sanitize(relX);
+            features[offset++] = Sanitize(relY);
         }
 
         // 3. Key velocities (6 features) - wrists, elbows, shoulders
         // These are the most discriminative for phase detection
-        int[] velocityJoints =
-        [
-            LeftWrist,
-            RightWrist,
-            LeftElbow,
-            RightElbow,
-            LeftShoulder,
-            RightShoulder,
-        ];
-        foreach (var jointIdx in velocityJoints)
+        foreach (var jointIdx in VelocityJoints)
         {
             // Normalize by a reasonable max velocity (pixels/second in normalized coords)
             var speed = keypoints[jointIdx].Speed ?? 0;
-            features.Add(Sanitize(speed / 500.0f));
+            features[offset++] = Sanitize(speed / 500.0f);
         }
 
         // 4. Arm configuration features (4 features)
@@ -160,41 +181,19 @@ public static class SwingPhaseFeatureExtractor
         // Wrist position relative to shoulder (captures arm extension/position)
         var wristToShoulderX = keypoints[dominantWrist].X - keypoints[dominantShoulder].X;
         var wristToShoulderY = keypoints[dominantWrist].Y - keypoints[dominantShoulder].Y;
-        features.Add(Sanitize(wristToShoulderX / torsoHeight));
-        features.Add(Sanitize(wristToShoulderY / torsoHeight));
+        features[offset++] = Sanitize(wristToShoulderX / torsoHeight);
+        features[offset++] = Sanitize(wristToShoulderY / torsoHeight);
 
         // Elbow angle relative to body centerline
         var elbowToHipX = keypoints[dominantElbow].X - hipCenterX;
-        features.Add(Sanitize(elbowToHipX / torsoHeight));
+        features[offset++] = Sanitize(elbowToHipX / torsoHeight);
 
         // Wrist height relative to shoulder (key for backswing vs followthrough)
         var wristHeightDiff = keypoints[dominantWrist].Y - keypoints[dominantShoulder].Y;
-        features.Add(Sanitize(wristHeightDiff / torsoHeight));
-    }
-
-    private static void AddZeroFeatures(List<float> features, int count)
-    {
-        for (int i = 0; i < count; i++)
-        {
-            features.Add(0.0f);
-        }
-    }
-
-    private static float[] GetAnglesFromFrameData(FrameData frame)
-    {
-        return
-        [
-            frame.LeftElbowAngle,
-            frame.RightElbowAngle,
-            frame.LeftShoulderAngle,
-            frame.RightShoulderAngle,
-            frame.LeftHipAngle,
-            frame.RightHipAngle,
-            frame.LeftKneeAngle,
-            frame.RightKneeAngle,
-        ];
+        features[offset] = Sanitize(wristHeightDiff / torsoHeight);
     }
 
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
     private static float Sanitize(float value)
     {
         if (float.IsNaN(value) || float.IsInfinity(value))
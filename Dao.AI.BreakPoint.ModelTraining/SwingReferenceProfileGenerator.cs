@@ -194,14 +194,41 @@ public class SwingReferenceProfileGenerator
             Maxs = new float[numFeatures],
         };
 
-        for (int f = 0; f < numFeatures; f++)
+        // Accumulate all statistics in a single pass over the frames instead of
+        // filtering and re-scanning the data once per statistic per feature.
+        // NaN/Infinity values are skipped as they accumulate, which replaces the
+        // separate filtering pass.
+        var counts = new int[numFeatures];
+        var sums = new double[numFeatures];
+        var sumSqs = new double[numFeatures];
+        var mins = new float[numFeatures];
+        var maxs = new float[numFeatures];
+        Array.Fill(mins, float.MaxValue);
+        Array.Fill(maxs, float.MinValue);
+
+        foreach (var frame in frames)
         {
-            var values = frames
-                .Select(frame => frame[f])
-                .Where(v => !float.IsNaN(v) && !float.IsInfinity(v))
-                .ToList();
+            for (int f = 0; f < numFeatures; f++)
+            {
+                var v = frame[f];
+                if (float.IsNaN(v) || float.IsInfinity(v))
+                {
+                    continue;
+                }
 
-            if (values.Count == 0)
+                counts[f]++;
+                sums[f] += v;
+                sumSqs[f] += (double)v * v;
+                if (v < mins[f])
+                    mins[f] = v;
+                if (v > maxs[f])
+                    maxs[f] = v;
+            }
+        }
+
+        for (int f = 0; f < numFeatures; f++)
+        {
+            if (counts[f] == 0)
             {
                 profile.Means[f] = 0;
                 profile.StdDevs[f] = 1; // Default to 1 to avoid division by zero
@@ -210,14 +237,14 @@ public class SwingReferenceProfileGenerator
                 continue;
             }
 
-            float mean = values.Average();
-            float variance = values.Sum(v => (v - mean) * (v - mean)) / values.Count;
-            float std = MathF.Sqrt(variance);
+            double mean = sums[f] / counts[f];
+            double variance = Math.Max(0, (sumSqs[f] / counts[f]) - (mean * mean));
+            float std = (float)Math.Sqrt(variance);
 
-            profile.Means[f] = mean;
+            profile.Means[f] = (float)mean;
             profile.StdDevs[f] = std > 0.001f ? std : 0.001f; // Minimum std to avoid division issues
-            profile.Mins[f] = values.Min();
-            profile.Maxs[f] = values.Max();
+            profile.Mins[f] = mins[f];
+            profile.Maxs[f] = maxs[f];
         }
 
         return profile;
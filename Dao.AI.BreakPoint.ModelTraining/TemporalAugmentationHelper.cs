@@ -227,8 +227,8 @@ public class TemporalAugmentationHelper
             // Use LegacyFrameJson to support both old (Features) and new (Joints/Angles) formats
             try
             {
-                var json = File.ReadAllText(file);
-                var frameData = JsonSerializer.Deserialize<LegacyFrameJson>(json, _jsonOptions);
+                using var stream = File.OpenRead(file);
+                var frameData = JsonSerializer.Deserialize<LegacyFrameJson>(stream, _jsonOptions);
 
                 if (frameData is null || frameData.Phase < 0)
                 {
@@ -467,8 +467,8 @@ public class TemporalAugmentationHelper
 
                 result[actualFrameIndex] = new ProcessedFrameData
                 {
-                    Joints = jointsFlat,
-                    Angles = sanitizedAngles,
+                    Joints = UnlabeledFrameJson.RoundForStorage(jointsFlat),
+                    Angles = UnlabeledFrameJson.RoundForStorage(sanitizedAngles),
                 };
             }
 
@@ -571,8 +571,8 @@ public class TemporalAugmentationHelper
         {
             try
             {
-                var json = File.ReadAllText(file);
-                var frameData = JsonSerializer.Deserialize<LegacyFrameJson>(json, _jsonOptions);
+                using var stream = File.OpenRead(file);
+                var frameData = JsonSerializer.Deserialize<LegacyFrameJson>(stream, _jsonOptions);
 
                 if (frameData?.Phase >= 0 && frameData.Phase < 5)
                 {
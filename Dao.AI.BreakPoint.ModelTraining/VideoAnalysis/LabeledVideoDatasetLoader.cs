@@ -1,4 +1,5 @@
 ﻿using System.Text.Json;
+using System.Threading.Channels;
 using Dao.AI.BreakPoint.Services.MoveNet;
 using Dao.AI.BreakPoint.Services.VideoProcessing;
 
@@ -11,6 +12,15 @@ internal class TrainingDatasetLoader(IVideoProcessingService VideoProcessingServ
     {
         PropertyNameCaseInsensitive = true,
         WriteIndented = true,
+        // Frame angles are NaN when joints fall below the confidence
+        // threshold; without this the swing cache write throws (and is
+        // swallowed) on every realistic video
+        NumberHandling = System
+            .Text
+            .Json
+            .Serialization
+            .JsonNumberHandling
+            .AllowNamedFloatingPointLiterals,
     };
 
     /// <summary>
@@ -38,48 +48,132 @@ internal class TrainingDatasetLoader(IVideoProcessingService VideoProcessingServ
 
         using var processor = new MoveNetVideoProcessor(moveNetModelPath, phaseClassifierModelPath);
 
-        foreach (var videoPath in videoFiles)
+        // Processed swings are cached per video so unchanged videos skip
+        // frame decoding and pose inference entirely on subsequent runs
+        var cacheDirectory = Path.Combine(videoDirectory, ".swingcache");
+
+        // Frame decoding (OpenCV) and pose inference (ONNX) are bound by
+        // different resources, so the two stages are overlapped: videos are
+        // decoded in parallel into a bounded channel while this thread
+        // consumes them for inference. Each video decodes independently, but
+        // inference stays on a single consumer because the processor shares
+        // one ONNX session and input buffer. The channel capacity bounds peak
+        // memory to a handful of decoded videos.
+        var channel = Channel.CreateBounded<DecodedTrainingVideo>(
+            new BoundedChannelOptions(4) { SingleReader = true, SingleWriter = false }
+        );
+
+        var decodeParallelism = Math.Clamp(Environment.ProcessorCount / 2, 1, 4);
+        var producer = Task.Run(async () =>
         {
             try
             {
-                var labelPath = Path.ChangeExtension(videoPath, ".json");
-
-                var label = await LoadVideoLabelAsync(labelPath);
-                Console.WriteLine(
-                    $"Processing video: {Path.GetFileName(videoPath)} (Stroke: {label.StrokeType}, Quality: {label.QualityScore}, RightHanded: {label.IsRightHanded})"
+                await Parallel.ForEachAsync(
+                    videoFiles,
+                    new ParallelOptions { MaxDegreeOfParallelism = decodeParallelism },
+                    async (videoPath, cancellationToken) =>
+                    {
+                        try
+                        {
+                            var labelPath = Path.ChangeExtension(videoPath, ".json");
+                            var label = await LoadVideoLabelAsync(labelPath);
+
+                            // Reuse cached swings when the video is unchanged
+                            var cachedSwings = TryLoadCachedSwings(
+                                cacheDirectory,
+                                videoPath,
+                                label.IsRightHanded
+                            );
+                            if (cachedSwings is not null)
+                            {
+                                await channel.Writer.WriteAsync(
+                                    new DecodedTrainingVideo(
+                                        videoPath,
+                                        label,
+                                        null,
+                                        null,
+                                        cachedSwings
+                                    ),
+                                    cancellationToken
+                                );
+                                return;
+                            }
+
+                            // Extract frames from video
+                            var frameImages = VideoProcessingService.ExtractFrames(videoPath);
+
+                            if (frameImages.Count == 0)
+                            {
+                                Console.WriteLine($"No frames extracted from video: {videoPath}");
+                                return;
+                            }
+                            var metadata = VideoProcessingService.GetVideoMetadata(videoPath);
+
+                            await channel.Writer.WriteAsync(
+                                new DecodedTrainingVideo(videoPath, label, frameImages, metadata),
+                                cancellationToken
+                            );
+                        }
+                        catch (Exception ex)
+                        {
+                            Console.WriteLine($"Error decoding video {videoPath}: {ex.Message}");
+                        }
+                    }
                 );
+            }
+            finally
+            {
+                channel.Writer.Complete();
+            }
+        });
 
-                // Extract frames from video
-                var frameImages = VideoProcessingService.ExtractFrames(videoPath);
-
-                if (frameImages.Count == 0)
+        await foreach (var decoded in channel.Reader.ReadAllAsync())
+        {
+            try
+            {
+                if (decoded.CachedSwings is not null)
                 {
-                    Console.WriteLine($"No frames extracted from video: {videoPath}");
+                    Console.WriteLine(
+                        $"Using cached swings for {Path.GetFileName(decoded.VideoPath)} ({decoded.CachedSwings.Swings.Count} swings)"
+                    );
+                    processedTrainingSwingVideos.Add(
+                        new() { TrainingLabel = decoded.Label, SwingVideo = decoded.CachedSwings }
+                    );
                     continue;
                 }
-                var metadata = VideoProcessingService.GetVideoMetadata(videoPath);
+
+                Console.WriteLine(
+                    $"Processing video: {Path.GetFileName(decoded.VideoPath)} (Stroke: {decoded.Label.StrokeType}, Quality: {decoded.Label.QualityScore}, RightHanded: {decoded.Label.IsRightHanded})"
+                );
 
                 // Split the videos in the different swings and analyze them
                 // Pass the handedness from the label for proper arm detection
                 var processedVideo = processor.ProcessVideoFrames(
-                    frameImages,
-                    metadata,
-                    label.IsRightHanded
+                    decoded.FrameImages!,
+                    decoded.Metadata!,
+                    decoded.Label.IsRightHanded
                 );
                 Console.WriteLine(
                     $"{processedVideo.Swings.Count} swings detected from this video."
                 );
+                SaveCachedSwings(
+                    cacheDirectory,
+                    decoded.VideoPath,
+                    decoded.Label.IsRightHanded,
+                    processedVideo
+                );
                 processedTrainingSwingVideos.Add(
-                    new() { TrainingLabel = label, SwingVideo = processedVideo }
+                    new() { TrainingLabel = decoded.Label, SwingVideo = processedVideo }
                 );
             }
             catch (Exception ex)
             {
-                Console.WriteLine($"Error processing video {videoPath}: {ex.Message}");
-                continue;
+                Console.WriteLine($"Error processing video {decoded.VideoPath}: {ex.Message}");
             }
         }
 
+        await producer;
+
         Console.WriteLine(
             $"Successfully processed {processedTrainingSwingVideos.Count} videos from directory"
         );
@@ -343,4 +437,107 @@ internal class TrainingDatasetLoader(IVideoProcessingService VideoProcessingServ
         File.WriteAllText(labelPath, jsonContent);
         Console.WriteLine($"Video label saved to: {labelPath}");
     }
+
+    /// <summary>
+    /// Try to load previously processed swings for a video. A cache entry is
+    /// only valid when the video file has not been modified since the entry
+    /// was written and was processed with the same handedness.
+    /// </summary>
+    private ProcessedSwingVideo? TryLoadCachedSwings(
+        string cacheDirectory,
+        string videoPath,
+        bool isRightHanded
+    )
+    {
+        var cachePath = GetCachePath(cacheDirectory, videoPath);
+        if (!File.Exists(cachePath))
+        {
+            return null;
+        }
+
+        try
+        {
+            var json = File.ReadAllText(cachePath);
+            var entry = JsonSerializer.Deserialize<CachedSwingVideo>(json, _jsonOptions);
+
+            if (
+                entry is null
+                || entry.VideoLastWriteUtc != File.GetLastWriteTimeUtc(videoPath)
+                || entry.IsRightHanded != isRightHanded
+            )
+            {
+                return null;
+            }
+
+            return entry.SwingVideo;
+        }
+        catch (Exception ex)
+        {
+            Console.WriteLine(
+                $"Warning: Could not read swing cache for {videoPath}: {ex.Message}"
+            );
+            return null;
+        }
+    }
+
+    /// <summary>
+    /// Persist processed swings for a video so unchanged videos can skip
+    /// decoding and pose inference on the next run. Cache failures only log;
+    /// they never fail dataset loading.
+    /// </summary>
+    private void SaveCachedSwings(
+        string cacheDirectory,
+        string videoPath,
+        bool isRightHanded,
+        ProcessedSwingVideo swingVideo
+    )
+    {
+        try
+        {
+            Directory.CreateDirectory(cacheDirectory);
+            var entry = new CachedSwingVideo(
+                File.GetLastWriteTimeUtc(videoPath),
+                isRightHanded,
+                swingVideo
+            );
+            var json = JsonSerializer.Serialize(entry, _jsonOptions);
+            File.WriteAllText(GetCachePath(cacheDirectory, videoPath), json);
+        }
+        catch (Exception ex)
+        {
+            Console.WriteLine(
+                $"Warning: Could not write swing cache for {videoPath}: {ex.Message}"
+            );
+        }
+    }
+
+    private static string GetCachePath(string cacheDirectory, string videoPath)
+    {
+        return Path.Combine(
+            cacheDirectory,
+            Path.GetFileNameWithoutExtension(videoPath) + ".swings.json"
+        );
+    }
+
+    /// <summary>
+    /// A decoded training video waiting for pose inference, or a cache hit
+    /// carrying the previously processed swings (FrameImages and Metadata are
+    /// null in that case).
+    /// </summary>
+    private sealed record DecodedTrainingVideo(
+        string VideoPath,
+        VideoLabel Label,
+        List<byte[]>? FrameImages,
+        VideoMetadata? Metadata,
+        ProcessedSwingVideo? CachedSwings = null
+    );
+
+    /// <summary>
+    /// On-disk cache entry for a processed training video.
+    /// </summary>
+    private sealed record CachedSwingVideo(
+        DateTime VideoLastWriteUtc,
+        bool IsRightHanded,
+        ProcessedSwingVideo SwingVideo
+    );
 }
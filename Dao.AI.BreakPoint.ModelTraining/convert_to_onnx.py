@@ -3,27 +3,86 @@
 Convert TorchScript (.pt) phase quality models to ONNX format.
 
 Usage:
-    python convert_to_onnx.py [models_directory]
-    
+    python convert_to_onnx.py [models_directory] [--fp16] [--int8]
+
 If no directory is provided, uses the current directory.
+With --fp16, the exported model weights are converted to float16,
+halving the artifact size and the bytes read per weight load.
+With --int8, a dynamically quantized copy is written alongside each
+export as <phase>.int8.onnx; the dense layers run as int8 GEMMs on
+CPU, roughly 2-3x faster than FP32 with no calibration data needed.
 
 Requirements:
     pip install torch onnx
+    pip install onnxconverter-common  # only for --fp16
+    pip install onnxruntime           # only for --int8
 """
 
 import sys
 import os
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import torch
 
-def convert_model(pt_path: str, onnx_path: str):
+@functools.lru_cache(maxsize=8)
+def _load_pt(pt_path, mtime):
+    """Load a TorchScript model, cached by path and modification time.
+
+    Re-running conversion in the same process (e.g. when imported from
+    another script) skips the parse for unchanged .pt files; a rewrite
+    changes the mtime and invalidates the entry automatically.
+    """
+    del mtime  # only part of the cache key
+    return torch.jit.load(pt_path)
+
+def convert_to_fp16(onnx_path: str):
+    """Convert an exported ONNX model's weights to float16 in place.
+
+    Compute still happens wherever the runtime decides; only the stored
+    weights shrink. These small MLPs lose no meaningful accuracy at
+    half precision.
+    """
+    try:
+        import onnx
+        from onnxconverter_common import float16
+    except ImportError:
+        print("  - Skipping fp16 conversion (pip install onnx onnxconverter-common)")
+        return
+
+    model = onnx.load(onnx_path)
+    model_fp16 = float16.convert_float_to_float16(model)
+    onnx.save(model_fp16, onnx_path)
+    print(f"  ✓ Converted to float16: {onnx_path}")
+
+def convert_to_int8(onnx_path: str):
+    """Write a dynamically quantized int8 copy next to the FP32 export.
+
+    The phase quality models are MatMul-heavy, so dynamic quantization
+    (weights stored int8, activations quantized on the fly) is enough;
+    no calibration dataset is required.
+    """
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+    except ImportError:
+        print("  - Skipping int8 quantization (pip install onnxruntime)")
+        return
+
+    int8_path = onnx_path.replace('.onnx', '.int8.onnx')
+    quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8)
+    print(f"  ✓ Quantized to int8: {int8_path}")
+
+def convert_model(pt_path: str, onnx_path: str, fp16: bool = False, int8: bool = False):
     """Convert a single TorchScript model to ONNX."""
     print(f"Loading: {pt_path}")
-    model = torch.jit.load(pt_path)
+    model = _load_pt(pt_path, os.path.getmtime(pt_path))
     model.eval()
     
-    # Input shape: batch_size x 60 features (20 features * 3 stats: mean, std, range)
+    # Input shape: 1 x 60 features (20 features * 3 stats: mean, std, range).
+    # The batch axis is deliberately static: inference always sends a single
+    # swing, and a fully static graph lets the runtime pick size-specialized
+    # kernels at load time instead of generic dynamic-shape ones.
     dummy_input = torch.randn(1, 60)
-    
+
     print(f"Exporting: {onnx_path}")
     torch.onnx.export(
         model,
@@ -31,17 +90,32 @@ def convert_model(pt_path: str, onnx_path: str):
         onnx_path,
         input_names=['features'],
         output_names=['quality_score'],
-        dynamic_axes={
-            'features': {0: 'batch_size'},
-            'quality_score': {0: 'batch_size'}
-        },
-        opset_version=13
+        do_constant_folding=True,
+        opset_version=17
     )
     print(f"  ✓ Saved: {onnx_path}")
 
+    if fp16:
+        convert_to_fp16(onnx_path)
+    if int8:
+        convert_to_int8(onnx_path)
+
+def _convert_one(task):
+    """Worker entry point: convert one model, returning (phase, success)."""
+    phase, pt_path, onnx_path, fp16, int8 = task
+    try:
+        convert_model(pt_path, onnx_path, fp16=fp16, int8=int8)
+        return phase, True
+    except Exception as e:
+        print(f"  ✗ Error converting {phase}: {e}")
+        return phase, False
+
 def main():
     # Get directory from args or use current directory
-    models_dir = sys.argv[1] if len(sys.argv) > 1 else "."
+    fp16 = '--fp16' in sys.argv
+    int8 = '--int8' in sys.argv
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    models_dir = args[0] if args else "."
     
     if not os.path.isdir(models_dir):
         print(f"Error: Directory not found: {models_dir}")
@@ -50,21 +124,27 @@ def main():
     # Phase model names
     phases = ['prep_quality', 'backswing_quality', 'contact_quality', 'followthrough_quality']
     
-    converted = 0
+    tasks = []
     for phase in phases:
         pt_path = os.path.join(models_dir, f"{phase}.pt")
         onnx_path = os.path.join(models_dir, f"{phase}.onnx")
-        
+
         if os.path.exists(pt_path):
-            try:
-                convert_model(pt_path, onnx_path)
-                converted += 1
-            except Exception as e:
-                print(f"  ✗ Error converting {phase}: {e}")
+            tasks.append((phase, pt_path, onnx_path, fp16, int8))
         else:
             print(f"  - Skipping {phase}.pt (not found)")
+
+    # The conversions are independent and CPU-bound (tracing + protobuf
+    # serialization), so they run in separate processes; wall-clock time is
+    # roughly that of the slowest single model.
+    converted = 0
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+            converted = sum(ok for _, ok in executor.map(_convert_one, tasks))
     
     print(f"\nConverted {converted}/{len(phases)} models")
+    if int8:
+        print("int8 copies written as <phase>.int8.onnx")
 
 if __name__ == "__main__":
     main()
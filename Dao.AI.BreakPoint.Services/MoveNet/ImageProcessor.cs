@@ -1,4 +1,5 @@
 using OpenCvSharp;
+using System.Runtime.InteropServices;
 using Tensorflow.NumPy;
 
 namespace Dao.AI.BreakPoint.Services.MoveNet;
@@ -23,22 +24,10 @@ public class ImageProcessor : IImageProcessor
         Cv2.Resize(rgbMat, resizedMat, new OpenCvSharp.Size(targetSize, targetSize), interpolation: InterpolationFlags.Linear);
 
         // 4. Convert to NDArray format [1, height, width, 3]
-        var imageData = new byte[targetSize * targetSize * 3];
-
-        // Copy pixel data from Mat to array using safe indexer
-        var indexer = resizedMat.GetGenericIndexer<Vec3b>();
-        int idx = 0;
-        for (int y = 0; y < targetSize; y++)
-        {
-            for (int x = 0; x < targetSize; x++)
-            {
-                var pixel = indexer[y, x];
-                imageData[idx] = pixel.Item0;     // R
-                imageData[idx + 1] = pixel.Item1; // G
-                imageData[idx + 2] = pixel.Item2; // B
-                idx += 3;
-            }
-        }
+        // The resized Mat is freshly allocated and therefore continuous, so the
+        // interleaved RGB bytes can be copied in bulk instead of pixel by pixel
+        // through the generic indexer.
+        var imageData = CopyMatData(resizedMat, targetSize);
 
         // 5. Create NDArray with shape [1, height, width, 3] and uint8 values
         var ndArray = np.array(imageData).reshape(new int[] { 1, targetSize, targetSize, 3 });
@@ -84,23 +73,28 @@ public class ImageProcessor : IImageProcessor
         Cv2.Resize(croppedMat, resizedMat, new OpenCvSharp.Size(cropSize, cropSize), interpolation: InterpolationFlags.Linear);
 
         // 4. Convert back to NDArray with shape [1, cropSize, cropSize, 3]
-        var resultData = new byte[cropSize * cropSize * 3];
+        var resultData = CopyMatData(resizedMat, cropSize);
 
-        var indexer = resizedMat.GetGenericIndexer<Vec3b>();
-        int idx = 0;
-        for (int y = 0; y < cropSize; y++)
+        var resultNDArray = np.array(resultData).reshape(new int[] { 1, cropSize, cropSize, 3 });
+        return resultNDArray.astype(np.uint8);
+    }
+
+    private static byte[] CopyMatData(Mat mat, int size)
+    {
+        var data = new byte[size * size * 3];
+        if (mat.IsContinuous())
+        {
+            Marshal.Copy(mat.Data, data, 0, data.Length);
+        }
+        else
         {
-            for (int x = 0; x < cropSize; x++)
+            // Non-continuous Mats (row padding) are copied row by row
+            int rowBytes = size * 3;
+            for (int y = 0; y < size; y++)
             {
-                var pixel = indexer[y, x];
-                resultData[idx] = pixel.Item0;     // R
-                resultData[idx + 1] = pixel.Item1; // G
-                resultData[idx + 2] = pixel.Item2; // B
-                idx += 3;
+                Marshal.Copy(mat.Ptr(y), data, y * rowBytes, rowBytes);
             }
         }
-
-        var resultNDArray = np.array(resultData).reshape(new int[] { 1, cropSize, cropSize, 3 });
-        return resultNDArray.astype(np.uint8);
+        return data;
     }
 }
\ No newline at end of file
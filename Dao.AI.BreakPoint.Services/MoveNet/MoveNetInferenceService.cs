@@ -10,6 +10,7 @@ public class MoveNetInferenceService : IDisposable, IPoseInferenceService
 {
     private readonly IImageProcessor _imageProcessor;
     private InferenceSession InferenceSession { get; set; }
+    private DenseTensor<int>? _inputTensor;
     private const float MinConfidence = 0.3f;
 
     public MoveNetInferenceService(string modelPath, IImageProcessor? imageProcessor = null)
@@ -34,7 +35,7 @@ public class MoveNetInferenceService : IDisposable, IPoseInferenceService
         float deltaTime = 1 / 30f)
     {
         // Convert NDArray to int tensor (model expects Int32 input)
-        var inputTensor = ToOnnxTensor(imageArray, targetSize);
+        var inputTensor = GetInputTensor(imageArray, targetSize);
 
         var inputs = new List<NamedOnnxValue>
         {
@@ -47,40 +48,44 @@ public class MoveNetInferenceService : IDisposable, IPoseInferenceService
         // MoveNet output shape: [1, 1, 17, 3] (batch, person, keypoints, [y,x,confidence])
         var keypoints = new JointData[MoveNetVideoProcessor.NumKeyPoints];
 
-        // Process each joint and calculate all properties as we go
+        // Process each joint and calculate all properties in a single pass.
+        // Velocity and acceleration share the previous-frame pixel position, so
+        // convert it once per joint instead of once per derivative.
+        var invDeltaTime = 1f / deltaTime;
+        var invDeltaTimeSq = invDeltaTime * invDeltaTime;
+
+        // Hoist the crop-region rescale out of the joint loop; without a crop
+        // region the transform is the identity
+        var yOffset = cropRegion?.YMin ?? 0f;
+        var yScale = cropRegion?.Height ?? 1f;
+        var xOffset = cropRegion?.XMin ?? 0f;
+        var xScale = cropRegion?.Width ?? 1f;
+
         for (int i = 0; i < MoveNetVideoProcessor.NumKeyPoints; i++)
         {
             int baseIdx = i * 3;
 
             // Get normalized coordinates from model output
-            var y = cropRegion is null ?
-                output[baseIdx] :
-                cropRegion.YMin + (cropRegion.Height * output[baseIdx]);
-            var x = cropRegion is null ?
-                output[baseIdx + 1] :
-                cropRegion.XMin + (cropRegion.Width * output[baseIdx + 1]);
+            var y = yOffset + (yScale * output[baseIdx]);
+            var x = xOffset + (xScale * output[baseIdx + 1]);
             var confidence = output[baseIdx + 2];
 
             // Convert to pixel coordinates
             var currentPixelPos = JointData.ToPixelCoordinates(x, y, imageHeight, imageWidth);
 
-            // Calculate velocity if previous frame exists
+            // Calculate velocity and acceleration from the previous frame(s)
             float? speed = null;
+            float? acceleration = null;
             if (prevFrame != null && confidence >= MinConfidence)
             {
                 var prevPixelPos = prevFrame.Joints[i].ToPixelCoordinates(imageHeight, imageWidth);
-                var velocity = (currentPixelPos - prevPixelPos) / deltaTime;
-                speed = velocity.Length();
-            }
+                speed = ((currentPixelPos - prevPixelPos) * invDeltaTime).Length();
 
-            // Calculate acceleration if two previous frames exist
-            float? acceleration = null;
-            if (prev2Frame != null && prevFrame != null && confidence >= MinConfidence)
-            {
-                var prevPixelPos = prevFrame.Joints[i].ToPixelCoordinates(imageHeight, imageWidth);
-                var prev2PixelPos = prev2Frame.Joints[i].ToPixelCoordinates(imageHeight, imageWidth);
-                var accel = (currentPixelPos - (2 * prevPixelPos) + prev2PixelPos) / (deltaTime * deltaTime);
-                acceleration = accel.Length();
+                if (prev2Frame != null)
+                {
+                    var prev2PixelPos = prev2Frame.Joints[i].ToPixelCoordinates(imageHeight, imageWidth);
+                    acceleration = ((currentPixelPos - (2 * prevPixelPos) + prev2PixelPos) * invDeltaTimeSq).Length();
+                }
             }
 
             keypoints[i] = new()
@@ -111,18 +116,25 @@ public class MoveNetInferenceService : IDisposable, IPoseInferenceService
         return positions.ComputeJointAngles(confidences, MinConfidence);
     }
 
-    private static DenseTensor<int> ToOnnxTensor(NDArray imageArray, int targetSize)
+    private DenseTensor<int> GetInputTensor(NDArray imageArray, int targetSize)
     {
-        // Model expects Int32 input, shape [1, targetSize, targetSize, 3], values 0-255
-        var shape = new[] { 1, targetSize, targetSize, 3 };
-        var tensor = new DenseTensor<int>(shape);
+        // Model expects Int32 input, shape [1, targetSize, targetSize, 3], values 0-255.
+        // MoveNet singlepose has a fixed batch dimension of 1, so the tensor is
+        // allocated once and refilled per frame instead of reallocated (~768 KB
+        // of garbage per frame otherwise).
+        if (_inputTensor is null || _inputTensor.Length != targetSize * targetSize * 3)
+        {
+            _inputTensor = new DenseTensor<int>(new[] { 1, targetSize, targetSize, 3 });
+        }
+
         var byteData = imageArray.ToByteArray();
+        var span = _inputTensor.Buffer.Span;
         for (int i = 0; i < byteData.Length; i++)
         {
-            tensor.Buffer.Span[i] = (int)byteData[i];
+            span[i] = byteData[i];
         }
 
-        return tensor;
+        return _inputTensor;
     }
 
     public JointData[] RunInference(
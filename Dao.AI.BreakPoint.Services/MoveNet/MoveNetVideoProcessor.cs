@@ -51,6 +51,14 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
 
         List<FrameData> currentSwingFrames = [];
 
+        // Track the swing progression (Backswing -> Contact -> FollowThrough)
+        // incrementally as frames are added, instead of re-scanning the whole
+        // frame list every time the tracker goes inactive. Contact is not
+        // required for a complete swing since it can easily be missed.
+        bool swingHasBackswing = false;
+        bool swingHasContact = false;
+        bool swingHasFollowThrough = false;
+
         float deltaTime = 1.0f / videoMetadata.FrameRate;
 
         FrameData? prev2Frame = null;
@@ -228,12 +236,14 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
                 // Check if we were tracking a swing that's now complete
                 if (
                     currentSwingFrames.Count >= MinSwingFrames
-                    && HasCompletedSwingProgression(currentSwingFrames)
+                    && swingHasBackswing
+                    && swingHasFollowThrough
                 )
                 {
                     // Ensure at least one Swing frame exists - find the transition point from Backswing to FollowThrough
-                    CompleteSwing(swings, currentSwingFrames);
+                    CompleteSwing(swings, currentSwingFrames, swingHasContact);
                     currentSwingFrames.Clear();
+                    swingHasBackswing = swingHasContact = swingHasFollowThrough = false;
                 }
                 // Reset tracking because it has gotten too far away from the other swings
                 else if (
@@ -242,6 +252,7 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
                 )
                 {
                     currentSwingFrames.Clear();
+                    swingHasBackswing = swingHasContact = swingHasFollowThrough = false;
                 }
                 continue;
             }
@@ -253,6 +264,9 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
             }
 
             currentSwingFrames.AddRange(firstFrameData, secondFrameData, thirdFrameData);
+            swingHasBackswing |= averageSwingPhase == SwingPhase.Backswing;
+            swingHasContact |= averageSwingPhase == SwingPhase.Contact;
+            swingHasFollowThrough |= averageSwingPhase == SwingPhase.FollowThrough;
 
             cropRegion = DetermineCropRegion(
                 thirdFrameData.Joints,
@@ -262,12 +276,9 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
         }
 
         // Handle any remaining swing at end of video
-        if (
-            currentSwingFrames.Count >= MinSwingFrames
-            && HasCompletedSwingProgression(currentSwingFrames)
-        )
+        if (currentSwingFrames.Count >= MinSwingFrames && swingHasBackswing && swingHasFollowThrough)
         {
-            CompleteSwing(swings, currentSwingFrames);
+            CompleteSwing(swings, currentSwingFrames, swingHasContact);
         }
 
         return new ProcessedSwingVideo
@@ -279,9 +290,13 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
         };
     }
 
-    private static void CompleteSwing(List<SwingData> swings, List<FrameData> currentSwingFrames)
+    private static void CompleteSwing(
+        List<SwingData> swings,
+        List<FrameData> currentSwingFrames,
+        bool hasContact
+    )
     {
-        if (!currentSwingFrames.Any(o => o.SwingPhase == SwingPhase.Contact))
+        if (!hasContact)
         {
             // Find the last Backswing frame (right before FollowThrough begins)
             for (int i = currentSwingFrames.Count - 1; i >= 0; i--)
@@ -303,18 +318,6 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
     private static bool IsActiveSwingPhase(SwingPhase phase) =>
         (phase is SwingPhase.Backswing or SwingPhase.Contact or SwingPhase.FollowThrough);
 
-    /// <summary>
-    /// Checks if a swing has completed a swing progression (Backswing -> Swing -> FollowThrough).
-    /// Doesnt check the swing phase because it can easily be missed since it is the contact point
-    /// </summary>
-    private static bool HasCompletedSwingProgression(List<FrameData> swingFrames)
-    {
-        bool hasBackswing = swingFrames.Any(f => f.SwingPhase == SwingPhase.Backswing);
-        bool hasFollowThrough = swingFrames.Any(f => f.SwingPhase == SwingPhase.FollowThrough);
-
-        return hasBackswing && hasFollowThrough;
-    }
-
     /// <summary>
     /// Determines if a frame should be included in the current swing based on AI phase classification.
     /// Relies primarily on the AI's phase detection while enforcing basic data quality checks.
@@ -354,13 +357,14 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
         int imageWidth
     )
     {
-        // Convert to pixel coordinates
-        var targetKeypoints = new Dictionary<JointFeatures, Vector2>();
+        // Convert to pixel coordinates in a flat array indexed by joint,
+        // instead of building a dictionary per frame. The array is contiguous
+        // and every lookup below becomes a plain index.
+        var targetKeypoints = new Vector2[NumKeyPoints];
 
-        foreach (var kvp in KeypointDict)
+        for (int idx = 0; idx < targetKeypoints.Length; idx++)
         {
-            int idx = kvp.Value;
-            targetKeypoints[kvp.Key] = new Vector2(
+            targetKeypoints[idx] = new Vector2(
                 keypoints[idx].X * imageWidth,
                 keypoints[idx].Y * imageHeight
             );
@@ -371,13 +375,13 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
             // Calculate center from hips
             float centerY =
                 (
-                    targetKeypoints[JointFeatures.LeftHip].Y
-                    + targetKeypoints[JointFeatures.RightHip].Y
+                    targetKeypoints[(int)JointFeatures.LeftHip].Y
+                    + targetKeypoints[(int)JointFeatures.RightHip].Y
                 ) / 2;
             float centerX =
                 (
-                    targetKeypoints[JointFeatures.LeftHip].X
-                    + targetKeypoints[JointFeatures.RightHip].X
+                    targetKeypoints[(int)JointFeatures.LeftHip].X
+                    + targetKeypoints[(int)JointFeatures.RightHip].X
                 ) / 2;
 
             var (maxTorsoYRange, maxTorsoXRange, maxBodyYRange, maxBodyXRange) =
@@ -388,8 +392,13 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
                 Math.Max(maxBodyYRange * 1.2f, maxBodyXRange * 1.2f)
             );
 
-            float[] tmp = [centerX, imageWidth - centerX, centerY, imageHeight - centerY];
-            cropLengthHalf = Math.Min(cropLengthHalf, tmp.Max());
+            // Clamp to the largest distance from the center to an image edge,
+            // without allocating a temporary array per frame for a 4-way max
+            float maxCenterToEdge = Math.Max(
+                Math.Max(centerX, imageWidth - centerX),
+                Math.Max(centerY, imageHeight - centerY)
+            );
+            cropLengthHalf = Math.Min(cropLengthHalf, maxCenterToEdge);
 
             var cropCorner = new Vector2(centerY - cropLengthHalf, centerX - cropLengthHalf);
 
@@ -431,45 +440,47 @@ public partial class MoveNetVideoProcessor(string moveNetModelPath, string phase
 
     private static (float, float, float, float) DetermineTorsoAndBodyRange(
         JointData[] keypoints,
-        Dictionary<JointFeatures, Vector2> targetKeypoints,
+        Vector2[] targetKeypoints,
         float centerY,
         float centerX
     )
     {
-        JointFeatures[] torsoJoints =
-        {
-            JointFeatures.LeftShoulder,
-            JointFeatures.RightShoulder,
-            JointFeatures.LeftHip,
-            JointFeatures.RightHip,
-        };
         float maxTorsoYRange = 0.0f;
         float maxTorsoXRange = 0.0f;
-
-        foreach (JointFeatures joint in torsoJoints)
-        {
-            float distY = Math.Abs(centerY - targetKeypoints[joint].Y);
-            float distX = Math.Abs(centerX - targetKeypoints[joint].X);
-            if (distY > maxTorsoYRange)
-                maxTorsoYRange = distY;
-            if (distX > maxTorsoXRange)
-                maxTorsoXRange = distX;
-        }
-
         float maxBodyYRange = 0.0f;
         float maxBodyXRange = 0.0f;
 
-        foreach (var kvp in KeypointDict)
+        // Single pass over all joints: shoulders and hips always contribute
+        // to the torso range, and any joint above the confidence threshold
+        // contributes to the body range. The per-joint distances are computed
+        // once and shared by both ranges.
+        for (int idx = 0; idx < keypoints.Length; idx++)
         {
-            if (keypoints[kvp.Value].Confidence < MinCropKeypointScore)
-                continue;
+            float distY = Math.Abs(centerY - targetKeypoints[idx].Y);
+            float distX = Math.Abs(centerX - targetKeypoints[idx].X);
+
+            bool isTorsoJoint =
+                idx
+                    is (int)JointFeatures.LeftShoulder
+                        or (int)JointFeatures.RightShoulder
+                        or (int)JointFeatures.LeftHip
+                        or (int)JointFeatures.RightHip;
 
-            float distY = Math.Abs(centerY - targetKeypoints[kvp.Key].Y);
-            float distX = Math.Abs(centerX - targetKeypoints[kvp.Key].X);
-            if (distY > maxBodyYRange)
-                maxBodyYRange = distY;
-            if (distX > maxBodyXRange)
-                maxBodyXRange = distX;
+            if (isTorsoJoint)
+            {
+                if (distY > maxTorsoYRange)
+                    maxTorsoYRange = distY;
+                if (distX > maxTorsoXRange)
+                    maxTorsoXRange = distX;
+            }
+
+            if (keypoints[idx].Confidence >= MinCropKeypointScore)
+            {
+                if (distY > maxBodyYRange)
+                    maxBodyYRange = distY;
+                if (distX > maxBodyXRange)
+                    maxBodyXRange = distX;
+            }
         }
 
         return (maxTorsoYRange, maxTorsoXRange, maxBodyYRange, maxBodyXRange);
@@ -1,4 +1,5 @@
 using Dao.AI.BreakPoint.Services.MoveNet;
+using System.Runtime.CompilerServices;
 
 namespace Dao.AI.BreakPoint.Services.SwingAnalyzer;
 
@@ -62,6 +63,24 @@ public static class LstmFeatureExtractor
     public static float[] ExtractFeatures(FrameData frame, FrameData? prevFrame, bool isRightHanded)
     {
         var features = new float[FeatureCount];
+        ExtractFeatures(frame, prevFrame, isRightHanded, features, 0);
+        return features;
+    }
+
+    /// <summary>
+    /// Extract features directly into <paramref name="destination"/> starting at
+    /// <paramref name="offset"/>. Used by sequence classifiers to fill a whole
+    /// [seqLen, 20] buffer in one pass without per-frame intermediate arrays.
+    /// </summary>
+    public static void ExtractFeatures(
+        FrameData frame,
+        FrameData? prevFrame,
+        bool isRightHanded,
+        float[] destination,
+        int offset
+    )
+    {
+        var features = destination.AsSpan(offset, FeatureCount);
         var joints = frame.Joints;
 
         // Determine dominant/non-dominant joints
@@ -136,16 +155,16 @@ public static class LstmFeatureExtractor
 
         // 5. HANDEDNESS (1 feature, index 19)
         features[19] = isRightHanded ? 1f : 0f;
-
-        return features;
     }
 
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
     private static float Normalize(float value, float maxExpected)
     {
         var normalized = value / maxExpected;
         return Sanitize(normalized);
     }
 
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
     private static float Sanitize(float value)
     {
         if (float.IsNaN(value) || float.IsInfinity(value))
@@ -153,6 +172,7 @@ public static class LstmFeatureExtractor
         return Math.Clamp(value, -3f, 3f);
     }
 
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
     private static float CalculateLineAngle(JointData p1, JointData p2)
     {
         float dx = p2.X - p1.X;
@@ -160,6 +180,7 @@ public static class LstmFeatureExtractor
         return MathF.Atan2(dy, dx) * (180f / MathF.PI);
     }
 
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
     private static float Distance(JointData p1, JointData p2)
     {
         float dx = p2.X - p1.X;
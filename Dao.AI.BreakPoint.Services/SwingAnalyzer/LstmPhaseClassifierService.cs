@@ -39,9 +39,11 @@ public class LstmPhaseClassifierService : IDisposable
             );
         }
 
+        // ORT_ENABLE_ALL adds layout optimizations and extra node fusions on
+        // top of EXTENDED; the fused graph is computed once at session load
         var sessionOptions = new SessionOptions
         {
-            GraphOptimizationLevel = GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+            GraphOptimizationLevel = GraphOptimizationLevel.ORT_ENABLE_ALL,
         };
         _session = new InferenceSession(modelPath, sessionOptions);
     }
@@ -62,29 +64,30 @@ public class LstmPhaseClassifierService : IDisposable
             return [];
         }
 
-        // Extract features for each frame
-        var featureSequence = new List<float[]>();
+        // Extract features for the whole sequence directly into the flat
+        // [1, seqLen, 20] tensor buffer in a single pass, instead of building
+        // per-frame arrays and copying them element by element.
+        var seqLen = frameSequence.Count;
+        var buffer = new float[seqLen * LstmFeatureExtractor.FeatureCount];
         FrameData? prevFrame = null;
 
-        foreach (var frame in frameSequence)
-        {
-            var features = LstmFeatureExtractor.ExtractFeatures(frame, prevFrame, isRightHanded);
-            featureSequence.Add(features);
-            prevFrame = frame;
-        }
-
-        // Create input tensor [1, seqLen, 20]
-        var seqLen = featureSequence.Count;
-        var inputTensor = new DenseTensor<float>([1, seqLen, LstmFeatureExtractor.FeatureCount]);
-
         for (int t = 0; t < seqLen; t++)
         {
-            for (int f = 0; f < LstmFeatureExtractor.FeatureCount; f++)
-            {
-                inputTensor[0, t, f] = featureSequence[t][f];
-            }
+            LstmFeatureExtractor.ExtractFeatures(
+                frameSequence[t],
+                prevFrame,
+                isRightHanded,
+                buffer,
+                t * LstmFeatureExtractor.FeatureCount
+            );
+            prevFrame = frameSequence[t];
         }
 
+        var inputTensor = new DenseTensor<float>(
+            buffer,
+            [1, seqLen, LstmFeatureExtractor.FeatureCount]
+        );
+
         // Run inference
         var inputs = new List<NamedOnnxValue>
         {
@@ -225,85 +225,118 @@ public class PhaseQualityInferenceService : IDisposable
         bool isRightHanded
     )
     {
-        var result = new PhaseQualityResult
-        {
-            StrokeType = strokeType,
-            IsRightHanded = isRightHanded,
-        };
-
-        if (swing.Frames.Count == 0)
-        {
-            return result;
-        }
+        return RunInferenceBatch([swing], strokeType, isRightHanded)[0];
+    }
 
-        // Group frames by phase
-        var framesByPhase = swing
-            .Frames.GroupBy(f => f.SwingPhase)
-            .ToDictionary(g => g.Key, g => g.ToList());
+    /// <summary>
+    /// Run inference for several swings at once. Aggregated features are
+    /// stacked into a single [batch, 60] tensor per phase model, so each MLP
+    /// runs one forward pass per phase instead of one per swing.
+    /// </summary>
+    public List<PhaseQualityResult> RunInferenceBatch(
+        List<SwingData> swings,
+        SwingType strokeType,
+        bool isRightHanded
+    )
+    {
+        var results = new List<PhaseQualityResult>(swings.Count);
+        var pendingByPhase =
+            new Dictionary<SwingPhase, List<(SinglePhaseResult Result, float[] Features)>>();
 
         // Get reference profile for this stroke type
         _referenceProfiles.TryGetValue(strokeType, out var referenceProfile);
 
-        // Score each phase
-        foreach (var phase in ScoredPhases)
+        foreach (var swing in swings)
         {
-            if (!framesByPhase.TryGetValue(phase, out var phaseFrames) || phaseFrames.Count == 0)
+            var result = new PhaseQualityResult
+            {
+                StrokeType = strokeType,
+                IsRightHanded = isRightHanded,
+            };
+            results.Add(result);
+
+            if (swing.Frames.Count == 0)
             {
-                // Phase not detected in swing
-                result.PhaseResults[phase] = new SinglePhaseResult
-                {
-                    Phase = phase,
-                    FrameCount = 0,
-                    Score = 0,
-                    IsFromModel = false,
-                    Deviations = [],
-                };
                 continue;
             }
 
-            // Extract and aggregate features for this phase
-            var aggregatedFeatures = AggregatePhaseFeatures(phaseFrames, isRightHanded);
-
-            // Get score from model or heuristic
-            float score;
-            bool isFromModel;
+            // Group frames by phase
+            var framesByPhase = swing
+                .Frames.GroupBy(f => f.SwingPhase)
+                .ToDictionary(g => g.Key, g => g.ToList());
 
-            if (_phaseModels.TryGetValue(phase, out var model) && model != null)
-            {
-                score = RunModelInference(model, aggregatedFeatures);
-                isFromModel = true;
-            }
-            else
+            // Score each phase
+            foreach (var phase in ScoredPhases)
             {
-                score = ComputeHeuristicScore(aggregatedFeatures, phase);
-                isFromModel = false;
-            }
+                if (
+                    !framesByPhase.TryGetValue(phase, out var phaseFrames)
+                    || phaseFrames.Count == 0
+                )
+                {
+                    // Phase not detected in swing
+                    result.PhaseResults[phase] = new SinglePhaseResult
+                    {
+                        Phase = phase,
+                        FrameCount = 0,
+                        Score = 0,
+                        IsFromModel = false,
+                        Deviations = [],
+                    };
+                    continue;
+                }
 
-            // Compute deviations from reference profile
-            var deviations = new List<FeatureDeviation>();
-            if (
-                referenceProfile != null
-                && referenceProfile.PhaseProfiles.TryGetValue(phase, out var phaseProfile)
-            )
-            {
-                deviations = ComputeDeviations(aggregatedFeatures, phaseProfile, isRightHanded);
+                // Extract and aggregate features for this phase
+                var aggregatedFeatures = AggregatePhaseFeatures(phaseFrames, isRightHanded);
+
+                bool isFromModel = _phaseModels.GetValueOrDefault(phase) != null;
+
+                // Compute deviations from reference profile
+                var deviations = new List<FeatureDeviation>();
+                if (
+                    referenceProfile != null
+                    && referenceProfile.PhaseProfiles.TryGetValue(phase, out var phaseProfile)
+                )
+                {
+                    deviations = ComputeDeviations(aggregatedFeatures, phaseProfile, isRightHanded);
+                }
+
+                var phaseResult = new SinglePhaseResult
+                {
+                    Phase = phase,
+                    FrameCount = phaseFrames.Count,
+                    Score = isFromModel ? 0 : ComputeHeuristicScore(aggregatedFeatures, phase),
+                    IsFromModel = isFromModel,
+                    Deviations = deviations,
+                    AggregatedFeatures = aggregatedFeatures,
+                };
+                result.PhaseResults[phase] = phaseResult;
+
+                if (isFromModel)
+                {
+                    // Model scores are filled in below, one batch per phase
+                    if (!pendingByPhase.TryGetValue(phase, out var pending))
+                    {
+                        pending = [];
+                        pendingByPhase[phase] = pending;
+                    }
+                    pending.Add((phaseResult, aggregatedFeatures));
+                }
             }
+        }
 
-            result.PhaseResults[phase] = new SinglePhaseResult
-            {
-                Phase = phase,
-                FrameCount = phaseFrames.Count,
-                Score = score,
-                IsFromModel = isFromModel,
-                Deviations = deviations,
-                AggregatedFeatures = aggregatedFeatures,
-            };
+        // One forward pass per phase model over all swings that hit that phase
+        foreach (var (phase, pending) in pendingByPhase)
+        {
+            RunModelInferenceBatch(_phaseModels[phase]!, pending);
         }
 
-        // Compute overall score as weighted average of phase scores
-        result.OverallScore = ComputeOverallScore(result.PhaseResults);
+        // Overall scores depend on the model scores, so compute them last
+        foreach (var result in results)
+        {
+            result.OverallScore = ComputeOverallScore(result.PhaseResults);
+        }
 
-        return result;
+        return results;
     }
 
     /// <summary>
@@ -388,27 +421,44 @@ public class PhaseQualityInferenceService : IDisposable
         var frameFeatures = frames.Select(f => ExtractFrameFeatures(f, isRightHanded)).ToList();
         var aggregated = new float[AggregatedFeatureCount];
 
+        // Accumulate count/sum/sum-of-squares/min/max in one pass per feature
+        // instead of materializing a filtered list and re-scanning it for each
+        // statistic.
         for (int f = 0; f < FeaturesPerFrame; f++)
         {
-            var values = frameFeatures
-                .Select(ff => ff[f])
-                .Where(v => !float.IsNaN(v) && !float.IsInfinity(v))
-                .ToList();
+            int count = 0;
+            double sum = 0;
+            double sumSq = 0;
+            float min = float.MaxValue;
+            float max = float.MinValue;
+
+            foreach (var ff in frameFeatures)
+            {
+                float v = ff[f];
+                if (float.IsNaN(v) || float.IsInfinity(v))
+                    continue;
+
+                count++;
+                sum += v;
+                sumSq += (double)v * v;
+                if (v < min)
+                    min = v;
+                if (v > max)
+                    max = v;
+            }
 
             int baseIdx = f * StatsPerFeature;
 
-            if (values.Count == 0)
+            if (count == 0)
             {
-                aggregated[baseIdx + 0] = 0f;
-                aggregated[baseIdx + 1] = 0f;
-                aggregated[baseIdx + 2] = 0f;
+                // Buffer is zero-initialized; nothing to write
                 continue;
             }
 
-            float mean = values.Average();
-            float variance = values.Sum(v => (v - mean) * (v - mean)) / values.Count;
+            float mean = (float)(sum / count);
+            float variance = Math.Max(0f, (float)((sumSq - (sum * sum / count)) / count));
             float std = MathF.Sqrt(variance);
-            float range = values.Max() - values.Min();
+            float range = max - min;
 
             aggregated[baseIdx + 0] = Sanitize(mean);
             aggregated[baseIdx + 1] = Sanitize(std);
@@ -418,22 +468,38 @@ public class PhaseQualityInferenceService : IDisposable
         return aggregated;
     }
 
-    private static float RunModelInference(PhaseQualityMlpModel model, float[] features)
+    private static void RunModelInferenceBatch(
+        PhaseQualityMlpModel model,
+        List<(SinglePhaseResult Result, float[] Features)> pending
+    )
     {
         using var noGrad = torch.no_grad();
 
-        // Create input tensor [1, 60]
-        var inputData = new float[PhaseQualityMlpModel.InputSize];
-        for (int i = 0; i < Math.Min(features.Length, PhaseQualityMlpModel.InputSize); i++)
+        // Stack all aggregated feature rows into one flat buffer and reshape
+        // to [batch, 60]; the model is in eval mode, so batch norm uses its
+        // running statistics and batching does not change per-row outputs.
+        var batch = new float[pending.Count * AggregatedFeatureCount];
+        for (int i = 0; i < pending.Count; i++)
         {
-            inputData[i] = features[i];
+            Array.Copy(
+                pending[i].Features,
+                0,
+                batch,
+                i * AggregatedFeatureCount,
+                AggregatedFeatureCount
+            );
         }
 
-        using var inputTensor = torch.tensor(inputData, dtype: torch.float32).reshape(1, -1);
+        using var inputTensor = torch
+            .tensor(batch, dtype: torch.float32)
+            .reshape(pending.Count, AggregatedFeatureCount);
         using var output = model.forward(inputTensor);
+        var scores = output.reshape(-1).data<float>().ToArray();
 
-        var score = output.item<float>();
-        return Math.Clamp(score, 0, 100);
+        for (int i = 0; i < pending.Count; i++)
+        {
+            pending[i].Result.Score = Math.Clamp(scores[i], 0, 100);
+        }
     }
 
     private static float ComputeHeuristicScore(float[] aggregatedFeatures, SwingPhase phase)
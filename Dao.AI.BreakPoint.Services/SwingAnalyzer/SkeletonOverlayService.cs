@@ -1,5 +1,6 @@
 using Dao.AI.BreakPoint.Services.MoveNet;
 using OpenCvSharp;
+using System.Runtime.InteropServices;
 using SixLabors.ImageSharp;
 using SixLabors.ImageSharp.Formats.Gif;
 using SixLabors.ImageSharp.PixelFormats;
@@ -47,6 +48,17 @@ public class SkeletonOverlayService : ISkeletonOverlayService
     private static readonly Scalar NeutralColor = new(255, 255, 0); // Cyan
     private static readonly Scalar BoneColor = new(255, 255, 255); // White
 
+    // Key joints (wrists, elbows, shoulders) used for per-frame confidence scoring
+    private static readonly int[] KeyConfidenceJoints =
+    [
+        (int)JointFeatures.LeftWrist,
+        (int)JointFeatures.RightWrist,
+        (int)JointFeatures.LeftElbow,
+        (int)JointFeatures.RightElbow,
+        (int)JointFeatures.LeftShoulder,
+        (int)JointFeatures.RightShoulder,
+    ];
+
     private const float MinConfidence = 0.3f;
     private const int JointRadius = 6;
     private const int BoneThickness = 2;
@@ -91,58 +103,78 @@ public class SkeletonOverlayService : ISkeletonOverlayService
     )
     {
         var problemJoints = GetProblemJoints(featureImportance);
-        var processedFrames = new List<Mat>();
 
-        try
+        int frameCount = Math.Min(frameImages.Count, swingData.Frames.Count);
+        if (frameCount == 0)
         {
-            // Find the worst frame (lowest confidence or specific criteria)
-            int worstFrameIndex = FindWorstFrameIndex(swingData, featureImportance);
+            return [];
+        }
 
-            for (int i = 0; i < Math.Min(frameImages.Count, swingData.Frames.Count); i++)
-            {
-                var frameImage = frameImages[i];
-                var frameData = swingData.Frames[i];
-
-                using var sourceMat = Mat.FromImageData(frameImage, ImreadModes.Color);
-
-                // Resize for GIF efficiency (max 480p)
-                var resizedMat = ResizeForGif(sourceMat);
-
-                // Draw skeleton with highlighting
-                bool isWorstFrame = i == worstFrameIndex;
-                DrawSkeleton(
-                    resizedMat,
-                    frameData.Joints,
-                    problemJoints,
-                    imageWidth,
-                    imageHeight,
-                    isWorstFrame
-                );
+        // Find the worst frame (lowest confidence or specific criteria)
+        int worstFrameIndex = FindWorstFrameIndex(swingData, featureImportance);
 
-                // Add minimal annotations (just score, no detailed text for GIF)
-                AddGifAnnotations(
-                    resizedMat,
-                    qualityScore,
-                    frameData,
-                    i,
-                    swingData.Frames.Count,
-                    isWorstFrame
-                );
+        // Pick the sampled indices up front so frames that will not appear in
+        // the GIF are never decoded or drawn at all
+        var sampledIndices = SampleFrameIndices(frameCount, maxFrames: 30);
 
-                processedFrames.Add(resizedMat);
-            }
+        // Drawing (decode + resize + skeleton + annotations) is independent
+        // per frame, so it runs on the thread pool while earlier frames are
+        // appended to the GIF; the semaphore bounds concurrent drawing.
+        var drawParallelism = Math.Clamp(Environment.ProcessorCount / 2, 1, 4);
+        using var drawSlots = new SemaphoreSlim(drawParallelism);
+        var drawTasks = new List<Task<Mat>>(sampledIndices.Count);
 
-            // Encode as GIF
-            return EncodeGif(processedFrames, frameDelayMs);
-        }
-        finally
+        foreach (var frameIndex in sampledIndices)
         {
-            // Dispose all frames
-            foreach (var frame in processedFrames)
-            {
-                frame.Dispose();
-            }
+            drawSlots.Wait();
+            int i = frameIndex;
+            drawTasks.Add(
+                Task.Run(() =>
+                {
+                    try
+                    {
+                        var frameData = swingData.Frames[i];
+                        using var sourceMat = Mat.FromImageData(
+                            frameImages[i],
+                            ImreadModes.Color
+                        );
+
+                        // Resize for GIF efficiency (max 480p)
+                        var resizedMat = ResizeForGif(sourceMat);
+
+                        // Draw skeleton with highlighting
+                        bool isWorstFrame = i == worstFrameIndex;
+                        DrawSkeleton(
+                            resizedMat,
+                            frameData.Joints,
+                            problemJoints,
+                            imageWidth,
+                            imageHeight,
+                            isWorstFrame
+                        );
+
+                        // Add minimal annotations (just score, no detailed text for GIF)
+                        AddGifAnnotations(
+                            resizedMat,
+                            qualityScore,
+                            frameData,
+                            i,
+                            swingData.Frames.Count,
+                            isWorstFrame
+                        );
+
+                        return resizedMat;
+                    }
+                    finally
+                    {
+                        drawSlots.Release();
+                    }
+                })
+            );
         }
+
+        // Encode as GIF, consuming drawn frames in order as they complete
+        return EncodeGif(drawTasks, frameDelayMs);
     }
 
     /// <summary>
@@ -164,19 +196,23 @@ public class SkeletonOverlayService : ISkeletonOverlayService
             var frame = swingData.Frames[i];
 
             // Calculate average confidence for key joints (wrists, elbows, shoulders)
-            var keyJoints = new[]
+            // in a single pass over the shared index table - no per-frame
+            // allocations or LINQ enumerators in this loop
+            float confidenceSum = 0;
+            int jointCount = 0;
+            foreach (var j in KeyConfidenceJoints)
             {
-                (int)JointFeatures.LeftWrist,
-                (int)JointFeatures.RightWrist,
-                (int)JointFeatures.LeftElbow,
-                (int)JointFeatures.RightElbow,
-                (int)JointFeatures.LeftShoulder,
-                (int)JointFeatures.RightShoulder,
-            };
-
-            float avgConfidence = keyJoints
-                .Where(j => j < frame.Joints.Length)
-                .Average(j => frame.Joints[j].Confidence);
+                if (j < frame.Joints.Length)
+                {
+                    confidenceSum += frame.Joints[j].Confidence;
+                    jointCount++;
+                }
+            }
+
+            if (jointCount == 0)
+                continue;
+
+            float avgConfidence = confidenceSum / jointCount;
 
             if (avgConfidence < lowestConfidence)
             {
@@ -513,11 +549,12 @@ public class SkeletonOverlayService : ISkeletonOverlayService
     }
 
     /// <summary>
-    /// Encode frames as an animated GIF using ImageSharp
+    /// Encode drawn frames as an animated GIF using ImageSharp, consuming
+    /// each drawing task in frame order as it completes
     /// </summary>
-    private static byte[] EncodeGif(List<Mat> frames, int frameDelayMs)
+    private static byte[] EncodeGif(List<Task<Mat>> frameTasks, int frameDelayMs)
     {
-        if (frames.Count == 0)
+        if (frameTasks.Count == 0)
         {
             return [];
         }
@@ -525,123 +562,123 @@ public class SkeletonOverlayService : ISkeletonOverlayService
         // Convert delay from milliseconds to centiseconds (GIF uses 1/100th second units)
         int frameDelay = Math.Max(1, frameDelayMs / 10);
 
-        // Sample frames to keep GIF size reasonable (max ~30 frames for a swing)
-        var sampledFrames = SampleFrames(frames, maxFrames: 30);
-
-        // Get dimensions from first frame
-        int width = sampledFrames[0].Width;
-        int height = sampledFrames[0].Height;
+        Image<Rgb24>? gif = null;
 
-        // Create the animated GIF
-        using var gif = new Image<Rgba32>(width, height);
-        var gifMetaData = gif.Metadata.GetGifMetadata();
-        gifMetaData.RepeatCount = 0; // Loop forever
-
-        bool isFirstFrame = true;
-        foreach (var cvFrame in sampledFrames)
+        try
         {
-            // Convert OpenCV Mat to ImageSharp Image
-            using var frameImage = ConvertMatToImageSharp(cvFrame);
+            foreach (var frameTask in frameTasks)
+            {
+                using var cvFrame = frameTask.Result;
 
-            // Get the root frame for the GIF
-            var rootFrame = gif.Frames.RootFrame;
+                // Convert OpenCV Mat to ImageSharp Image
+                using var frameImage = ConvertMatToImageSharp(cvFrame);
 
-            if (isFirstFrame)
-            {
-                // Copy first frame data directly to root frame
-                frameImage.Frames.RootFrame.ProcessPixelRows(
-                    rootFrame,
-                    (sourceAccessor, targetAccessor) =>
-                    {
-                        for (int y = 0; y < sourceAccessor.Height; y++)
+                if (gif == null)
+                {
+                    // Create the animated GIF from the first frame's dimensions
+                    // (GIF has no alpha channel, so RGB is enough)
+                    gif = new Image<Rgb24>(cvFrame.Width, cvFrame.Height);
+                    var gifMetaData = gif.Metadata.GetGifMetadata();
+                    gifMetaData.RepeatCount = 0; // Loop forever
+
+                    // Copy first frame data directly to root frame
+                    var rootFrame = gif.Frames.RootFrame;
+                    frameImage.Frames.RootFrame.ProcessPixelRows(
+                        rootFrame,
+                        (sourceAccessor, targetAccessor) =>
                         {
-                            var sourceRow = sourceAccessor.GetRowSpan(y);
-                            var targetRow = targetAccessor.GetRowSpan(y);
-                            sourceRow.CopyTo(targetRow);
+                            for (int y = 0; y < sourceAccessor.Height; y++)
+                            {
+                                var sourceRow = sourceAccessor.GetRowSpan(y);
+                                var targetRow = targetAccessor.GetRowSpan(y);
+                                sourceRow.CopyTo(targetRow);
+                            }
                         }
-                    }
-                );
-
-                // Set delay on root frame
-                var rootMeta = rootFrame.Metadata.GetGifMetadata();
-                rootMeta.FrameDelay = frameDelay;
+                    );
 
-                isFirstFrame = false;
+                    // Set delay on root frame
+                    var rootMeta = rootFrame.Metadata.GetGifMetadata();
+                    rootMeta.FrameDelay = frameDelay;
+                }
+                else
+                {
+                    // Add subsequent frames
+                    var addedFrame = gif.Frames.AddFrame(frameImage.Frames.RootFrame);
+                    var frameMeta = addedFrame.Metadata.GetGifMetadata();
+                    frameMeta.FrameDelay = frameDelay;
+                }
             }
-            else
+
+            // Encode to byte array
+            using var ms = new MemoryStream();
+            var encoder = new GifEncoder { ColorTableMode = GifColorTableMode.Local };
+            gif!.SaveAsGif(ms, encoder);
+            return ms.ToArray();
+        }
+        finally
+        {
+            gif?.Dispose();
+
+            // Frames are disposed as they are consumed above; this sweep only
+            // matters if encoding failed part-way (Mat ignores double dispose)
+            foreach (var frameTask in frameTasks)
             {
-                // Add subsequent frames
-                var addedFrame = gif.Frames.AddFrame(frameImage.Frames.RootFrame);
-                var frameMeta = addedFrame.Metadata.GetGifMetadata();
-                frameMeta.FrameDelay = frameDelay;
+                if (frameTask.IsCompletedSuccessfully)
+                {
+                    frameTask.Result.Dispose();
+                }
             }
         }
-
-        // Encode to byte array
-        using var ms = new MemoryStream();
-        var encoder = new GifEncoder { ColorTableMode = GifColorTableMode.Local };
-        gif.SaveAsGif(ms, encoder);
-        return ms.ToArray();
     }
 
     /// <summary>
-    /// Sample frames to reduce GIF size while maintaining smooth animation
+    /// Pick evenly spaced frame indices to keep GIF size reasonable
+    /// while maintaining smooth animation
     /// </summary>
-    private static List<Mat> SampleFrames(List<Mat> frames, int maxFrames)
+    private static List<int> SampleFrameIndices(int frameCount, int maxFrames)
     {
-        if (frames.Count <= maxFrames)
+        if (frameCount <= maxFrames)
         {
-            return frames;
+            return [.. Enumerable.Range(0, frameCount)];
         }
 
-        var sampled = new List<Mat>();
-        double step = (double)frames.Count / maxFrames;
+        var sampled = new List<int>(maxFrames);
+        double step = (double)frameCount / maxFrames;
 
         for (int i = 0; i < maxFrames; i++)
         {
             int frameIndex = (int)(i * step);
-            if (frameIndex < frames.Count)
+            if (frameIndex < frameCount)
             {
-                sampled.Add(frames[frameIndex]);
+                sampled.Add(frameIndex);
             }
         }
 
         // Always include last frame
-        if (sampled.Count > 0 && sampled[^1] != frames[^1])
+        if (sampled.Count > 0 && sampled[^1] != frameCount - 1)
         {
-            sampled[^1] = frames[^1];
+            sampled[^1] = frameCount - 1;
         }
 
         return sampled;
     }
 
     /// <summary>
-    /// Convert OpenCV Mat (BGR) to ImageSharp Image (RGBA)
+    /// Convert OpenCV Mat (BGR) to ImageSharp Image (RGB)
     /// </summary>
-    private static Image<Rgba32> ConvertMatToImageSharp(Mat mat)
+    private static Image<Rgb24> ConvertMatToImageSharp(Mat mat)
     {
-        // Convert BGR to RGB
+        // Convert BGR to RGB with a single native call
         using var rgbMat = new Mat();
         Cv2.CvtColor(mat, rgbMat, ColorConversionCodes.BGR2RGB);
 
-        // Create ImageSharp image
-        var image = new Image<Rgba32>(mat.Width, mat.Height);
-
-        // Copy pixel data
-        image.ProcessPixelRows(accessor =>
-        {
-            for (int y = 0; y < accessor.Height; y++)
-            {
-                var pixelRow = accessor.GetRowSpan(y);
-                for (int x = 0; x < accessor.Width; x++)
-                {
-                    var pixel = rgbMat.At<Vec3b>(y, x);
-                    pixelRow[x] = new Rgba32(pixel.Item0, pixel.Item1, pixel.Item2, 255);
-                }
-            }
-        });
+        // The converted Mat is freshly allocated and continuous, so the
+        // interleaved RGB bytes load in one bulk copy instead of reading
+        // every pixel through At<Vec3b>
+        var pixelData = new byte[rgbMat.Width * rgbMat.Height * 3];
+        Marshal.Copy(rgbMat.Data, pixelData, 0, pixelData.Length);
 
-        return image;
+        return Image.LoadPixelData<Rgb24>(pixelData, rgbMat.Width, rgbMat.Height);
     }
 }
 
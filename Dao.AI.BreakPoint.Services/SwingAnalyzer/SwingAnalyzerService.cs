@@ -53,6 +53,12 @@ public class SwingAnalyzerService(
         );
         var swingVideo = processor.ProcessVideoFrames(frameImages, metadata, isRightHanded);
 
+        // The full decoded frame list is only needed for pose processing.
+        // Release it here; overlay generation re-reads just the best swing's
+        // frame range from the temp file, keeping peak memory bounded for
+        // long videos.
+        frameImages.Clear();
+
         if (swingVideo.Swings.Count == 0)
         {
             throw new InvalidOperationException("No valid swings detected in the video.");
@@ -65,16 +71,13 @@ public class SwingAnalyzerService(
             qualityOptions.ReferenceProfilesPath
         );
 
-        var swingResults = new List<PhaseQualityResult>();
-        foreach (var swing in swingVideo.Swings)
-        {
-            var result = qualityService.RunInference(
-                swing,
-                analysisRequest.StrokeType,
-                isRightHanded
-            );
-            swingResults.Add(result);
-        }
+        // Score all swings in one batched call: one forward pass per phase
+        // model instead of one per swing
+        var swingResults = qualityService.RunInferenceBatch(
+            swingVideo.Swings,
+            analysisRequest.StrokeType,
+            isRightHanded
+        );
 
         // Aggregate results (use best swing for now, could average in future)
         var bestResult = swingResults.OrderByDescending(r => r.OverallScore).First();
@@ -186,7 +189,7 @@ public class SwingAnalyzerService(
 
         // Generate skeleton overlay GIF for the best swing
         await GenerateAndUploadSkeletonOverlayAsync(
-            frameImages,
+            tempFilePath,
             bestSwing,
             bestResult,
             metadata.Width,
@@ -215,7 +218,7 @@ public class SwingAnalyzerService(
     /// Generate skeleton overlay GIF and key frame image, then upload to blob storage
     /// </summary>
     private async Task GenerateAndUploadSkeletonOverlayAsync(
-        List<byte[]> allFrames,
+        string videoPath,
         SwingData swing,
         PhaseQualityResult result,
         int videoWidth,
@@ -225,15 +228,31 @@ public class SwingAnalyzerService(
     {
         try
         {
+            if (swing.Frames.Count == 0)
+            {
+                return;
+            }
+
+            // Second pass over the video: read back only this swing's frame
+            // range instead of holding every decoded frame through the whole
+            // analysis
+            int startFrame = swing.Frames[0].FrameIndex;
+            int endFrame = swing.Frames[^1].FrameIndex;
+            var rangeFrames = VideoProcessingService.ExtractFrameRange(
+                videoPath,
+                startFrame,
+                endFrame
+            );
+
             // Extract only the frames that correspond to this swing using actual frame indices
             var swingFrameImages = new List<byte[]>();
             foreach (var frameData in swing.Frames)
             {
-                // Use the actual frame index from the FrameData
-                int frameIndex = frameData.FrameIndex;
-                if (frameIndex >= 0 && frameIndex < allFrames.Count)
+                // Frame indices are offset by the start of the extracted range
+                int rangeIndex = frameData.FrameIndex - startFrame;
+                if (rangeIndex >= 0 && rangeIndex < rangeFrames.Count)
                 {
-                    swingFrameImages.Add(allFrames[frameIndex]);
+                    swingFrameImages.Add(rangeFrames[rangeIndex]);
                 }
             }
 
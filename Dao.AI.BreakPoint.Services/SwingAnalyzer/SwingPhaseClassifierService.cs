@@ -2,6 +2,7 @@ using Dao.AI.BreakPoint.Data.Enums;
 using Dao.AI.BreakPoint.Services.MoveNet;
 using Microsoft.ML.OnnxRuntime;
 using Microsoft.ML.OnnxRuntime.Tensors;
+using System.Runtime.CompilerServices;
 
 namespace Dao.AI.BreakPoint.Services.SwingAnalyzer;
 
@@ -24,6 +25,11 @@ public class SwingPhaseClassifierService : IDisposable
         AngleFeatures + RelativePositionFeatures + VelocityFeatures + ArmConfigFeatures; // 30
     private const int TotalFeatures = (FeaturesPerFrame * 3) + 1; // 3 frames + handedness = 91
 
+    // ML.NET exported ONNX requires both Features and Label inputs. The label
+    // value is ignored at inference time but the shape must be [1, 1], so the
+    // constant tensor is built once instead of per classified frame.
+    private static readonly DenseTensor<uint> LabelTensor = new(new uint[] { 0 }, [1, 1]);
+
     // Key joint indices
     private const int LeftShoulder = 5;
     private const int RightShoulder = 6;
@@ -34,6 +40,27 @@ public class SwingPhaseClassifierService : IDisposable
     private const int LeftHip = 11;
     private const int RightHip = 12;
 
+    // Joints used for the relative-position and velocity feature blocks,
+    // hoisted so the index tables are not reallocated per frame
+    private static readonly int[] RelativeJoints =
+    [
+        LeftWrist,
+        RightWrist,
+        LeftElbow,
+        RightElbow,
+        LeftShoulder,
+        RightShoulder,
+    ];
+    private static readonly int[] VelocityJoints =
+    [
+        LeftWrist,
+        RightWrist,
+        LeftElbow,
+        RightElbow,
+        LeftShoulder,
+        RightShoulder,
+    ];
+
     /// <summary>
     /// Creates a new SwingPhaseClassifierService.
     /// </summary>
@@ -58,8 +85,10 @@ public class SwingPhaseClassifierService : IDisposable
             );
         }
 
+        // ORT_ENABLE_ALL adds layout optimizations and extra node fusions on
+        // top of EXTENDED; the fused graph is computed once at session load
         var sessionOptions = new SessionOptions();
-        sessionOptions.GraphOptimizationLevel = GraphOptimizationLevel.ORT_ENABLE_EXTENDED;
+        sessionOptions.GraphOptimizationLevel = GraphOptimizationLevel.ORT_ENABLE_ALL;
         _session = new InferenceSession(modelPath, sessionOptions);
     }
 
@@ -77,14 +106,10 @@ public class SwingPhaseClassifierService : IDisposable
         var features = ExtractFeatures(keypoints, angles, isRightHanded, prevFrame, prev2Frame);
         var inputTensor = CreateInputTensor(features);
 
-        // ML.NET exported ONNX requires both Features and Label inputs
-        // Shape must be [1, 1] (batch_size, 1)
-        var labelTensor = new DenseTensor<uint>(new uint[] { 0 }, [1, 1]);
-
         var inputs = new List<NamedOnnxValue>
         {
             NamedOnnxValue.CreateFromTensor("Features", inputTensor),
-            NamedOnnxValue.CreateFromTensor("Label", labelTensor),
+            NamedOnnxValue.CreateFromTensor("Label", LabelTensor),
         };
 
         using var results = _session.Run(inputs);
@@ -117,49 +142,35 @@ public class SwingPhaseClassifierService : IDisposable
         FrameData? prev2Frame
     )
     {
-        var features = new List<float>();
+        // Write into a preallocated buffer at fixed offsets instead of growing
+        // a list and copying it out. Missing previous frames keep the buffer's
+        // zero initialization, so no explicit zero-fill pass is needed.
+        var features = new float[TotalFeatures];
 
         // Current frame features
-        AddFrameFeatures(features, keypoints, angles, isRightHanded);
+        AddFrameFeatures(features, 0, keypoints, angles, isRightHanded);
 
         // Previous frame features (or zeros if not available)
         if (prevFrame != null)
         {
-            AddFrameFeatures(
-                features,
-                prevFrame.Joints,
-                GetAnglesFromFrameData(prevFrame),
-                isRightHanded
-            );
-        }
-        else
-        {
-            AddZeroFrameFeatures(features);
+            AddFrameFeatures(features, FeaturesPerFrame, prevFrame, isRightHanded);
         }
 
         // Previous-previous frame features (or zeros if not available)
         if (prev2Frame != null)
         {
-            AddFrameFeatures(
-                features,
-                prev2Frame.Joints,
-                GetAnglesFromFrameData(prev2Frame),
-                isRightHanded
-            );
-        }
-        else
-        {
-            AddZeroFrameFeatures(features);
+            AddFrameFeatures(features, FeaturesPerFrame * 2, prev2Frame, isRightHanded);
         }
 
         // Handedness (constant across frames)
-        features.Add(isRightHanded ? 1.0f : 0.0f);
+        features[TotalFeatures - 1] = isRightHanded ? 1.0f : 0.0f;
 
-        return [.. features];
+        return features;
     }
 
     private static void AddFrameFeatures(
-        List<float> features,
+        float[] features,
+        int offset,
         JointData[] keypoints,
         float[] angles,
         bool isRightHanded
@@ -168,9 +179,40 @@ public class SwingPhaseClassifierService : IDisposable
         // 1. Joint angles (8 features) - these are pose-invariant
         foreach (var angle in angles)
         {
-            features.Add(Sanitize(angle / 180.0f));
+            features[offset++] = Sanitize(angle / 180.0f);
         }
 
+        AddBodyFeatures(features, offset, keypoints, isRightHanded);
+    }
+
+    private static void AddFrameFeatures(
+        float[] features,
+        int offset,
+        FrameData frame,
+        bool isRightHanded
+    )
+    {
+        // 1. Joint angles, written straight from the frame's stored fields
+        // instead of copying them into a temporary array first
+        features[offset++] = Sanitize(frame.LeftElbowAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightElbowAngle / 180.0f);
+        features[offset++] = Sanitize(frame.LeftShoulderAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightShoulderAngle / 180.0f);
+        features[offset++] = Sanitize(frame.LeftHipAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightHipAngle / 180.0f);
+        features[offset++] = Sanitize(frame.LeftKneeAngle / 180.0f);
+        features[offset++] = Sanitize(frame.RightKneeAngle / 180.0f);
+
+        AddBodyFeatures(features, offset, frame.Joints, isRightHanded);
+    }
+
+    private static void AddBodyFeatures(
+        float[] features,
+        int offset,
+        JointData[] keypoints,
+        bool isRightHanded
+    )
+    {
         // Calculate hip center as reference point
         var hipCenterX = (keypoints[LeftHip].X + keypoints[RightHip].X) / 2;
         var hipCenterY = (keypoints[LeftHip].Y + keypoints[RightHip].Y) / 2;
@@ -180,37 +222,19 @@ public class SwingPhaseClassifierService : IDisposable
         var torsoHeight = Math.Max(0.1f, Math.Abs(hipCenterY - shoulderCenterY));
 
         // 2. Relative positions of key joints (12 features)
-        int[] relativeJoints =
-        [
-            LeftWrist,
-            RightWrist,
-            LeftElbow,
-            RightElbow,
-            LeftShoulder,
-            RightShoulder,
-        ];
-        foreach (var jointIdx in relativeJoints)
+        foreach (var jointIdx in RelativeJoints)
         {
             var relX = (keypoints[jointIdx].X - hipCenterX) / torsoHeight;
             var relY = (keypoints[jointIdx].Y - hipCenterY) / torsoHeight;
-            features.Add(Sanitize(relX));
-            features.Add(Sanitize(relY));
+            features[offset++] = Sanitize(relX);
+            features[offset++] = Sanitize(relY);
         }
 
         // 3. Key velocities (6 features)
-        int[] velocityJoints =
-        [
-            LeftWrist,
-            RightWrist,
-            LeftElbow,
-            RightElbow,
-            LeftShoulder,
-            RightShoulder,
-        ];
-        foreach (var jointIdx in velocityJoints)
+        foreach (var jointIdx in VelocityJoints)
         {
             var speed = keypoints[jointIdx].Speed ?? 0;
-            features.Add(Sanitize(speed / 500.0f));
+            features[offset++] = Sanitize(speed / 500.0f);
         }
 
         // 4. Arm configuration features (4 features)
@@ -220,24 +244,17 @@ public class SwingPhaseClassifierService : IDisposable
 
         var wristToShoulderX = keypoints[dominantWrist].X - keypoints[dominantShoulder].X;
         var wristToShoulderY = keypoints[dominantWrist].Y - keypoints[dominantShoulder].Y;
-        features.Add(Sanitize(wristToShoulderX / torsoHeight));
-        features.Add(Sanitize(wristToShoulderY / torsoHeight));
+        features[offset++] = Sanitize(wristToShoulderX / torsoHeight);
+        features[offset++] = Sanitize(wristToShoulderY / torsoHeight);
 
         var elbowToHipX = keypoints[dominantElbow].X - hipCenterX;
-        features.Add(Sanitize(elbowToHipX / torsoHeight));
+        features[offset++] = Sanitize(elbowToHipX / torsoHeight);
 
         var wristHeightDiff = keypoints[dominantWrist].Y - keypoints[dominantShoulder].Y;
-        features.Add(Sanitize(wristHeightDiff / torsoHeight));
-    }
-
-    private static void AddZeroFrameFeatures(List<float> features)
-    {
-        for (int i = 0; i < FeaturesPerFrame; i++)
-        {
-            features.Add(0.0f);
-        }
+        features[offset] = Sanitize(wristHeightDiff / torsoHeight);
     }
 
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
     private static float Sanitize(float value)
     {
         if (float.IsNaN(value) || float.IsInfinity(value))
@@ -245,21 +262,6 @@ public class SwingPhaseClassifierService : IDisposable
         return Math.Clamp(value, -10f, 10f);
     }
 
-    private static float[] GetAnglesFromFrameData(FrameData frame)
-    {
-        return
-        [
-            frame.LeftElbowAngle,
-            frame.RightElbowAngle,
-            frame.LeftShoulderAngle,
-            frame.RightShoulderAngle,
-            frame.LeftHipAngle,
-            frame.RightHipAngle,
-            frame.LeftKneeAngle,
-            frame.RightKneeAngle,
-        ];
-    }
-
     private static DenseTensor<float> CreateInputTensor(float[] features)
     {
         var tensor = new DenseTensor<float>([1, features.Length]);
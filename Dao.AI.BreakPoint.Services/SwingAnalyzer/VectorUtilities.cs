@@ -1,117 +1,95 @@
-﻿using Dao.AI.BreakPoint.Services.MoveNet;
+using Dao.AI.BreakPoint.Services.MoveNet;
 using System.Numerics;
+using System.Runtime.CompilerServices;
 
 namespace Dao.AI.BreakPoint.Services.SwingAnalyzer;
 
 public static class VectorUtilities
 {
+    // Joint triplets (a, b, c) defining each of the 8 angles, measured at b:
+    // [0] left elbow, [1] right elbow, [2] left shoulder, [3] right shoulder,
+    // [4] left hip, [5] right hip, [6] left knee, [7] right knee
+    private static readonly JointFeatures[] AngleJointsA =
+    [
+        JointFeatures.LeftShoulder,
+        JointFeatures.RightShoulder,
+        JointFeatures.LeftElbow,
+        JointFeatures.RightElbow,
+        JointFeatures.LeftShoulder,
+        JointFeatures.RightShoulder,
+        JointFeatures.LeftHip,
+        JointFeatures.RightHip,
+    ];
+
+    private static readonly JointFeatures[] AngleJointsB =
+    [
+        JointFeatures.LeftElbow,
+        JointFeatures.RightElbow,
+        JointFeatures.LeftShoulder,
+        JointFeatures.RightShoulder,
+        JointFeatures.LeftHip,
+        JointFeatures.RightHip,
+        JointFeatures.LeftKnee,
+        JointFeatures.RightKnee,
+    ];
+
+    private static readonly JointFeatures[] AngleJointsC =
+    [
+        JointFeatures.LeftWrist,
+        JointFeatures.RightWrist,
+        JointFeatures.LeftHip,
+        JointFeatures.RightHip,
+        JointFeatures.LeftKnee,
+        JointFeatures.RightKnee,
+        JointFeatures.LeftAnkle,
+        JointFeatures.RightAnkle,
+    ];
+
     /// <summary>
-    /// Compute 8 joint angles (elbows, shoulders, hips, knees)
+    /// Compute 8 joint angles (elbows, shoulders, hips, knees).
+    /// Angles with any low-confidence joint are set to NaN.
     /// </summary>
     public static float[] ComputeJointAngles(this Vector2[] positions, float[] confidences, float minConfidence)
     {
-        var angles = new float[8];
-
-        // Left elbow: shoulder-elbow-wrist
-        angles[0] = AngleBetween(
-            positions[(int)JointFeatures.LeftShoulder],
-            positions[(int)JointFeatures.LeftElbow],
-            positions[(int)JointFeatures.LeftWrist]);
-        if (confidences[(int)JointFeatures.LeftShoulder] < minConfidence ||
-            confidences[(int)JointFeatures.LeftElbow] < minConfidence ||
-            confidences[(int)JointFeatures.LeftWrist] < minConfidence)
-            angles[0] = float.NaN;
-
-        // Right elbow
-        angles[1] = AngleBetween(
-            positions[(int)JointFeatures.RightShoulder],
-            positions[(int)JointFeatures.RightElbow],
-            positions[(int)JointFeatures.RightWrist]);
-        if (confidences[(int)JointFeatures.RightShoulder] < minConfidence ||
-            confidences[(int)JointFeatures.RightElbow] < minConfidence ||
-            confidences[(int)JointFeatures.RightWrist] < minConfidence)
-            angles[1] = float.NaN;
-
-        // Left shoulder: elbow-shoulder-hip
-        angles[2] = AngleBetween(
-            positions[(int)JointFeatures.LeftElbow],
-            positions[(int)JointFeatures.LeftShoulder],
-            positions[(int)JointFeatures.LeftHip]);
-        if (confidences[(int)JointFeatures.LeftElbow] < minConfidence ||
-            confidences[(int)JointFeatures.LeftShoulder] < minConfidence ||
-            confidences[(int)JointFeatures.LeftHip] < minConfidence)
-            angles[2] = float.NaN;
+        var angles = new float[AngleJointsB.Length];
 
-        // Right shoulder
-        angles[3] = AngleBetween(
-            positions[(int)JointFeatures.RightElbow],
-            positions[(int)JointFeatures.RightShoulder],
-            positions[(int)JointFeatures.RightHip]);
-        if (confidences[(int)JointFeatures.RightElbow] < minConfidence ||
-            confidences[(int)JointFeatures.RightShoulder] < minConfidence ||
-            confidences[(int)JointFeatures.RightHip] < minConfidence)
-            angles[3] = float.NaN;
+        for (int i = 0; i < angles.Length; i++)
+        {
+            int a = (int)AngleJointsA[i];
+            int b = (int)AngleJointsB[i];
+            int c = (int)AngleJointsC[i];
 
-        // Left hip: shoulder-hip-knee
-        angles[4] = AngleBetween(
-            positions[(int)JointFeatures.LeftShoulder],
-            positions[(int)JointFeatures.LeftHip],
-            positions[(int)JointFeatures.LeftKnee]);
-        if (confidences[(int)JointFeatures.LeftShoulder] < minConfidence ||
-            confidences[(int)JointFeatures.LeftHip] < minConfidence ||
-            confidences[(int)JointFeatures.LeftKnee] < minConfidence)
-            angles[4] = float.NaN;
+            if (confidences[a] < minConfidence ||
+                confidences[b] < minConfidence ||
+                confidences[c] < minConfidence)
+            {
+                angles[i] = float.NaN;
+                continue;
+            }
 
-        // Right hip
-        angles[5] = AngleBetween(
-            positions[(int)JointFeatures.RightShoulder],
-            positions[(int)JointFeatures.RightHip],
-            positions[(int)JointFeatures.RightKnee]);
-        if (confidences[(int)JointFeatures.RightShoulder] < minConfidence ||
-            confidences[(int)JointFeatures.RightHip] < minConfidence ||
-            confidences[(int)JointFeatures.RightKnee] < minConfidence)
-            angles[5] = float.NaN;
-
-        // Left knee: hip-knee-ankle
-        angles[6] = AngleBetween(
-            positions[(int)JointFeatures.LeftHip],
-            positions[(int)JointFeatures.LeftKnee],
-            positions[(int)JointFeatures.LeftAnkle]);
-        if (confidences[(int)JointFeatures.LeftHip] < minConfidence ||
-            confidences[(int)JointFeatures.LeftKnee] < minConfidence ||
-            confidences[(int)JointFeatures.LeftAnkle] < minConfidence)
-            angles[6] = float.NaN;
-
-        // Right knee
-        angles[7] = AngleBetween(
-            positions[(int)JointFeatures.RightHip],
-            positions[(int)JointFeatures.RightKnee],
-            positions[(int)JointFeatures.RightAnkle]);
-        if (confidences[(int)JointFeatures.RightHip] < minConfidence ||
-            confidences[(int)JointFeatures.RightKnee] < minConfidence ||
-            confidences[(int)JointFeatures.RightAnkle] < minConfidence)
-            angles[7] = float.NaN;
+            angles[i] = AngleBetween(positions[a], positions[b], positions[c]);
+        }
 
         return angles;
     }
 
     /// <summary>
-    /// Calculate angle at point b formed by points a-b-c (in degrees)
+    /// Calculate angle at point b formed by points a-b-c (in degrees).
+    /// Uses atan2(|cross|, dot), which is more numerically stable near
+    /// 0° and 180° than acos of the normalized dot product.
     /// </summary>
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
     public static float AngleBetween(Vector2 a, Vector2 b, Vector2 c)
     {
         var v1 = a - b;
         var v2 = c - b;
 
-        float n1 = v1.Length();
-        float n2 = v2.Length();
-
-        if (n1 == 0 || n2 == 0)
+        if ((v1.X == 0 && v1.Y == 0) || (v2.X == 0 && v2.Y == 0))
             return float.NaN;
 
-        float cosAngle = Vector2.Dot(v1, v2) / (n1 * n2);
-        cosAngle = Math.Clamp(cosAngle, -1.0f, 1.0f);
+        float cross = (v1.X * v2.Y) - (v1.Y * v2.X);
+        float dot = Vector2.Dot(v1, v2);
 
-        return (float)(Math.Acos(cosAngle) * 180.0 / Math.PI);
+        return MathF.Atan2(Math.Abs(cross), dot) * (180f / MathF.PI);
     }
 }
@@ -12,8 +12,6 @@ public class OpenCvVideoProcessingService : IVideoProcessingService
             throw new FileNotFoundException($"Video file not found: {videoPath}");
         }
 
-        var frames = new List<byte[]>();
-
         using var capture = new VideoCapture(videoPath);
         if (!capture.IsOpened())
         {
@@ -24,6 +22,24 @@ public class OpenCvVideoProcessingService : IVideoProcessingService
         int frameCount = 0;
         int extractedCount = 0;
 
+        // Decoding has to stay sequential (the capture owns the decoder
+        // state), but JPEG encoding is independent per frame, so encodes run
+        // on the thread pool while the next frame decodes. The semaphore
+        // bounds how many cloned raw frames are in flight at once; task order
+        // preserves frame order.
+        var encodeParallelism = Math.Clamp(Environment.ProcessorCount / 2, 1, 4);
+        using var encodeSlots = new SemaphoreSlim(encodeParallelism);
+
+        // Size the task list from the container's frame count up front so it
+        // never regrows mid-extraction; the count is advisory for some
+        // codecs, so it is only a capacity hint, not a bound.
+        int expectedFrames = (int)capture.Get(VideoCaptureProperties.FrameCount);
+        if (maxFrames != -1)
+        {
+            expectedFrames = Math.Min(expectedFrames, maxFrames);
+        }
+        var encodeTasks = new List<Task<byte[]>>(Math.Max(expectedFrames, 0));
+
         while (capture.Read(frame) && (maxFrames == -1 || extractedCount < maxFrames))
         {
             if (frame.Empty()) break;
@@ -31,15 +47,34 @@ public class OpenCvVideoProcessingService : IVideoProcessingService
             // Skip frames if specified
             if (frameCount % (skipFrames + 1) == 0)
             {
-                // Convert frame to JPEG bytes
-                var frameBytes = frame.ToBytes(".jpg");
-                frames.Add(frameBytes);
+                encodeSlots.Wait();
+                var frameCopy = frame.Clone();
+                encodeTasks.Add(
+                    Task.Run(() =>
+                    {
+                        try
+                        {
+                            return frameCopy.ToBytes(".jpg");
+                        }
+                        finally
+                        {
+                            frameCopy.Dispose();
+                            encodeSlots.Release();
+                        }
+                    })
+                );
                 extractedCount++;
             }
 
             frameCount++;
         }
 
+        var frames = new List<byte[]>(encodeTasks.Count);
+        foreach (var encodeTask in encodeTasks)
+        {
+            frames.Add(encodeTask.Result);
+        }
+
         Console.WriteLine($"Extracted {frames.Count} frames from {videoPath}");
         return frames;
     }
@@ -77,7 +112,8 @@ public class OpenCvVideoProcessingService : IVideoProcessingService
             throw new FileNotFoundException($"Video file not found: {videoPath}");
         }
 
-        var frames = new List<byte[]>();
+        // The range is inclusive, so the frame count is known up front
+        var frames = new List<byte[]>(Math.Max(endFrame - startFrame + 1, 0));
 
         using var capture = new VideoCapture(videoPath);
         if (!capture.IsOpened())